@@ -0,0 +1,95 @@
+"""
+Benchmarks that need a display. Run one of them with:
+    python3 benchmarks.py <name>
+where <name> is one of the keys of `BENCHMARKS`.
+"""
+from __future__ import annotations
+from multiprocessing import get_context
+from random import randint, seed
+from time import perf_counter
+import tkinter as tk
+import sys
+
+try:
+    from betterframe import BetterCanvas, BetterFrame
+except ImportError:
+    from .betterframe import BetterCanvas, BetterFrame
+
+
+def spatial_index() -> None:
+    """
+    BetterCanvas's spatial index with 100k rectangles
+    """
+    seed(0)
+    root = tk.Tk()
+    canvas = BetterCanvas(root, width=400, height=400, cull_margin=100,
+                          scrollregion=(0, 0, 400, 50_000))
+    canvas.pack()
+    root.update_idletasks()
+
+    start:float = perf_counter()
+    for _ in range(100_000):
+        x, y = randint(0, 380), randint(0, 49_980)
+        canvas.create_rectangle(x, y, x+20, y+20, fill="red")
+    print(f"create 100k rectangles: {perf_counter()-start:.3f} sec")
+
+    start:float = perf_counter()
+    for i in range(1000):
+        canvas.find_in_rect(0, i*40, 400, i*40+400)
+    print(f"1k range queries (index): {perf_counter()-start:.3f} sec")
+    start:float = perf_counter()
+    for i in range(1000):
+        canvas.find_overlapping(0, i*40, 400, i*40+400)
+    print(f"1k range queries (find_overlapping): {perf_counter()-start:.3f} sec")
+
+    start:float = perf_counter()
+    for i in range(1000):
+        canvas.find_at(200, i*40)
+    print(f"1k hover queries (index): {perf_counter()-start:.3f} sec")
+
+    start:float = perf_counter()
+    for i in range(1000):
+        canvas.yview_scroll(1, "units")
+    print(f"1k scroll steps with culling: {perf_counter()-start:.3f} sec")
+    root.destroy()
+
+
+def _first_paint_of_labels(bulk:bool) -> None:
+    root = tk.Tk()
+    frame = BetterFrame(root, height=200, hscroll=False, vscroll=True)
+    frame.pack(fill="both", expand=True)
+    root.update()
+    start:float = perf_counter()
+    if bulk:
+        with frame.bulk_add():
+            for i in range(5000):
+                tk.Label(frame, text=f"Label number {i}").pack(anchor="w")
+    else:
+        for i in range(5000):
+            tk.Label(frame, text=f"Label number {i}").pack(anchor="w")
+    root.update()
+    print(f"5k labels ({bulk=}): {perf_counter()-start:.3f} sec")
+    root.destroy()
+
+def bulk_add() -> None:
+    """
+    Time to first paint of 5k labels with/without `BetterFrame.bulk_add`.
+      Each one runs in its own process so that the second one doesn't
+      start with the first one's font/layout caches.
+    """
+    context = get_context("spawn")
+    for bulk in (False, True):
+        process = context.Process(target=_first_paint_of_labels, args=(bulk,))
+        process.start()
+        process.join()
+
+
+BENCHMARKS:dict[str,Function[None]] = {"spatial_index": spatial_index,
+                                       "bulk_add": bulk_add}
+
+
+if __name__ == "__main__":
+    names:list[str] = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        assert name in BENCHMARKS, f"Unknown benchmark: {name!r}"
+        BENCHMARKS[name]()
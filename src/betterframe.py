@@ -1,9 +1,18 @@
 from __future__ import annotations
+from contextlib import contextmanager
 import tkinter as tk
 
+try:
+    from scrollengine import ScrollEngine
+except ImportError:
+    from .scrollengine import ScrollEngine
 
+
+SCROLL_UNIT:int = 20 # The number of pixels in each `scroll_speed` unit
 FIT_WIDTH = "fit_width"
 FIT_HEIGHT = "fit_height"
+ALWAYS_FIT_WIDTH = "always_fit_width"
+ALWAYS_FIT_HEIGHT = "always_fit_height"
 
 
 # .bind on this frame binds to all its children
@@ -30,35 +39,318 @@ class BindFrame(tk.Frame):
     __slots__ = ()
 
     def bind(self, seq:str, func:Function, add:bool=False) -> str:
-        def wrapper(event:tk.Event) -> str:
-            if isinstance(event.widget, str):
-                return ""
-            ewidget:str = event.widget._w
-            swidget:str = self._w
-            if not ewidget.startswith(swidget):
-                return ""
-            if "toplevel" in ewidget.removeprefix(swidget):
-                return ""
-            return func(event)
-        self.bind_all(seq, wrapper, add=add)
+        return BindDispatcher.get(self).register(self, seq, func, add=add)
+
+    def unbind(self, seq:str, funcid:str=None) -> None:
+        BindDispatcher.get(self).unregister(self, seq, funcid)
 
 def make_bind_frame(frame:tk.Frame) -> None:
     frame.bind = lambda *args, **kwargs: BindFrame.bind(frame, *args, **kwargs)
+    frame.unbind = lambda *args, **kwargs: BindFrame.unbind(frame, *args,
+                                                            **kwargs)
+
+
+class RootSingleton:
+    """
+    For classes that have exactly one instance per tcl interpreter. Use
+      `cls.get(widget)` which creates the instance (with the root as the
+      only argument) the first time and stores it as `ROOT_ATTR` on the
+      root.
+    """
+    __slots__ = ()
+    ROOT_ATTR:str = None
+
+    @classmethod
+    def get(cls, widget:tk.Misc) -> RootSingleton:
+        root:tk.Tk = widget._root()
+        instance:RootSingleton = getattr(root, cls.ROOT_ATTR, None)
+        if instance is None:
+            instance:RootSingleton = cls(root)
+            setattr(root, cls.ROOT_ATTR, instance)
+        return instance
+
+
+class BindDispatcher(RootSingleton):
+    """
+    Used by `BindFrame`. There is only one `bind_all` per sequence (per
+      tcl interpreter). On each event, the registered frames that contain
+      `event.widget` (without a toplevel in between) are looked up in
+      `self.ancestors` which is cached per widget path, so events on
+      unrelated widgets only cost a dict lookup. The cache is cleared
+      when a frame is (un)registered and when it gets too big. A frame's
+      handlers are removed when the frame is destroyed.
+    """
+    __slots__ = "root", "handlers", "ancestors", "watching", "next_id"
+    ROOT_ATTR:str = "_bind_dispatcher"
+    MAX_ANCESTORS:int = 4096
+
+    def __init__(self, root:tk.Misc) -> BindDispatcher:
+        # handlers[seq][frame_path][funcid] = func
+        self.handlers:dict[str,dict[str,dict[str,Function]]] = {}
+        self.ancestors:dict[str,tuple[str]] = {}
+        # The paths of the frames with a <Destroy> binding from us
+        self.watching:set[str] = set()
+        self.root:tk.Misc = root
+        self.next_id:int = 0
+
+    def register(self, frame:tk.Misc, seq:str, func:Function,
+                 add:bool=False) -> str:
+        """
+        Returns an id that can be passed to `unregister` (like the return
+          value of `tk.Misc.bind`)
+        """
+        handlers:dict[str,dict[str,Function]] = self.handlers.get(seq, None)
+        if handlers is None:
+            handlers = self.handlers[seq] = {}
+            dispatch = lambda event: self.dispatch(seq, event)
+            self.root.bind_all(seq, dispatch, add=True)
+        path:str = str(frame)
+        if (path not in handlers) or (not add):
+            handlers[path] = {}
+        funcid:str = f"bindframe{self.next_id}"
+        self.next_id += 1
+        handlers[path][funcid] = func
+        self.ancestors.clear()
+        if path not in self.watching:
+            self.watching.add(path)
+            # `tk.Misc.bind` because `frame.bind` might be `BindFrame.bind`
+            tk.Misc.bind(frame, "<Destroy>", self._on_destroy, add=True)
+        return funcid
+
+    def unregister(self, frame:tk.Misc|str, seq:str=None,
+                   funcid:str=None) -> None:
+        """
+        Removes the handler with `funcid` or (if it's `None`) all of the
+          handlers for `seq` (or for all sequences if `seq` is `None`)
+        """
+        path:str = str(frame)
+        seqs:Iterable[str] = self.handlers if seq is None else (seq,)
+        for seq in seqs:
+            handlers:dict[str,dict[str,Function]] = self.handlers.get(seq, {})
+            if funcid is not None:
+                handlers.get(path, {}).pop(funcid, None)
+                if handlers.get(path, None):
+                    continue
+            handlers.pop(path, None)
+        self.ancestors.clear()
+
+    def _get_ancestors(self, path:str) -> tuple[str]:
+        """
+        Returns the paths of the registered frames that contain `path`
+          (innermost first) stopping at the first toplevel.
+        """
+        ancestors:tuple[str] = self.ancestors.get(path, None)
+        if ancestors is not None:
+            return ancestors
+        registered:set[str] = set()
+        for handlers in self.handlers.values():
+            registered.update(handlers)
+        output:list[str] = []
+        current:str = path
+        while current:
+            if current in registered:
+                output.append(current)
+            current, _, name = current.rpartition(".")
+            if "toplevel" in name:
+                break
+        if len(self.ancestors) >= self.MAX_ANCESTORS:
+            # Destroyed widgets leave their entries behind
+            self.ancestors.clear()
+        ancestors = self.ancestors[path] = tuple(output)
+        return ancestors
+
+    def _on_destroy(self, event:tk.Event) -> None:
+        path:str = str(event.widget)
+        # Toplevels also get the <Destroy> events of their children
+        if path in self.watching:
+            self.watching.discard(path)
+            self.unregister(path)
+
+    def dispatch(self, seq:str, event:tk.Event) -> str:
+        if isinstance(event.widget, str):
+            return ""
+        handlers:dict[str,dict[str,Function]] = self.handlers[seq]
+        for path in self._get_ancestors(event.widget._w):
+            for func in tuple(handlers.get(path, {}).values()):
+                if func(event) == "break":
+                    return "break"
+        return ""
+
+
+class WheelDispatcher(RootSingleton):
+    """
+    One set of `bind_all` mouse wheel bindings per tcl interpreter (instead
+      of one per scrollable widget). On each event, it walks up from
+      `event.widget`'s path until it finds a registered scrollable widget
+      so the cost of each event is O(depth) dict lookups no matter how
+      many scrollable widgets exist. Only the innermost scrollable widget
+      gets the event.
+    Use `WheelDispatcher.get(widget).register(container, callback)`.
+      The callback is called with the event for all mouse wheel events
+      over `container` or any of its children. It's automatically
+      unregistered when `container` is destroyed.
+    """
+    __slots__ = "registry"
+    ROOT_ATTR:str = "_wheel_dispatcher"
 
+    def __init__(self, root:tk.Misc) -> WheelDispatcher:
+        self.registry:dict[str,Function[tk.Event,str|None]] = {}
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            root.bind_all(sequence, self.dispatch, add=True)
 
-# A canvas that implements all of the scrollbar stuff by moving all of
-# the items. Useless for now.
+    def register(self, container:tk.Misc,
+                 callback:Function[tk.Event,str|None]) -> None:
+        path:str = str(container)
+        self.registry[path] = callback
+        def on_destroy(event:tk.Event) -> None:
+            if str(event.widget) == path:
+                self.unregister(path)
+        container.bind("<Destroy>", on_destroy, add=True)
+
+    def unregister(self, container:tk.Misc|str) -> None:
+        self.registry.pop(str(container), None)
+
+    def dispatch(self, event:tk.Event) -> str|None:
+        path:str = str(event.widget)
+        while path:
+            callback = self.registry.get(path, None)
+            if callback is not None:
+                callback(event)
+                return None
+            path:str = path.rpartition(".")[0]
+        return None
+
+
+class SpatialGrid:
+    """
+    A uniform grid spatial index of bounding boxes. Each item is stored in
+      all of the `cell_size`x`cell_size` cells that its bounding box
+      touches so range/point queries only look at the cells that overlap
+      the query (instead of all of the items).
+    """
+    __slots__ = "cell_size", "cells", "bboxes"
+
+    def __init__(self, cell_size:int=128) -> SpatialGrid:
+        self.cells:dict[tuple[int,int],set[int]] = {}
+        self.bboxes:dict[int,tuple[int,int,int,int]] = {}
+        self.cell_size:int = cell_size
+
+    def __len__(self) -> int:
+        return len(self.bboxes)
+
+    def __contains__(self, item:int) -> bool:
+        return item in self.bboxes
+
+    def _cells(self, x1:int, y1:int, x2:int, y2:int) -> Iterable[tuple[int]]:
+        size:int = self.cell_size
+        for cx in range(int(x1//size), int(x2//size)+1):
+            for cy in range(int(y1//size), int(y2//size)+1):
+                yield (cx, cy)
+
+    def insert(self, item:int, bbox:tuple[int,int,int,int]) -> None:
+        if item in self.bboxes:
+            self.remove(item)
+        self.bboxes[item] = bbox
+        for cell in self._cells(*bbox):
+            items:set[int] = self.cells.get(cell, None)
+            if items is None:
+                items = self.cells[cell] = set()
+            items.add(item)
+
+    def remove(self, item:int) -> None:
+        bbox:tuple[int,int,int,int] = self.bboxes.pop(item, None)
+        if bbox is None:
+            return None
+        for cell in self._cells(*bbox):
+            items:set[int] = self.cells[cell]
+            items.discard(item)
+            if not items:
+                self.cells.pop(cell)
+
+    def move(self, item:int, dx:int, dy:int) -> None:
+        x1, y1, x2, y2 = self.bboxes[item]
+        self.insert(item, (x1+dx, y1+dy, x2+dx, y2+dy))
+
+    def clear(self) -> None:
+        self.cells.clear()
+        self.bboxes.clear()
+
+    def query(self, x1:int, y1:int, x2:int, y2:int) -> set[int]:
+        """
+        Returns all of the items whose bounding box overlaps the rectangle
+        """
+        size:int = self.cell_size
+        n_cells:int = (int(x2//size)-int(x1//size)+1) * \
+                      (int(y2//size)-int(y1//size)+1)
+        if n_cells > len(self.cells):
+            # Huge query, it's faster to go through the non empty cells
+            cells:Iterable[set[int]] = (items
+                                        for (cx, cy), items in self.cells.items()
+                                        if (x1//size <= cx <= x2//size) and
+                                           (y1//size <= cy <= y2//size))
+        else:
+            cells:Iterable[set[int]] = filter(None, map(self.cells.get,
+                                                  self._cells(x1, y1, x2, y2)))
+        output:set[int] = set()
+        bboxes:dict[int,tuple[int,int,int,int]] = self.bboxes
+        for items in cells:
+            for item in items:
+                if item in output:
+                    continue
+                ix1, iy1, ix2, iy2 = bboxes[item]
+                if (ix1 <= x2) and (x1 <= ix2) and (iy1 <= y2) and (y1 <= iy2):
+                    output.add(item)
+        return output
+
+    def query_point(self, x:int, y:int) -> set[int]:
+        return self.query(x, y, x, y)
+
+
+# A canvas that implements all of the scrollbar stuff itself. It scrolls
+# by moving the view (not the items) so scrolling is O(1). It can also
+# keep a spatial index of its items (`spatial_index`) that is used for
+# queries and for hiding the items that are far away from the viewport
+# (`cull_margin`).
 class BetterCanvas(tk.Canvas):
     __slots__ = "deltax", "deltay", "xscrollcommand", "yscrollcommand", \
-                "scrollregion"
+                "scrollregion", "cull_margin", "spatial_index", "_shown", \
+                "_viewport", "scroller"
 
-    def __init__(self, master, **kwargs):
+    def __init__(self, master, cull_margin:int=None,
+                 spatial_index:bool=False, **kwargs):
+        """
+        If `spatial_index` is `True` (or `cull_margin` isn't `None`), the
+          bounding boxes of the items are kept in `self.spatial_index` (a
+          `SpatialGrid`). All of the canvas methods that can change an
+          item's bounding box re-read it. If an item changes in any other
+          way (for example a named font that it uses is reconfigured),
+          call `reindex`.
+        If `cull_margin` isn't `None`, items that aren't within
+          `cull_margin` pixels of the viewport are hidden. `state` is
+          overwritten for all of the tracked items.
+        """
         self.deltax = 0
         self.deltay = 0
         self.xscrollcommand = None
         self.yscrollcommand = None
         self.scrollregion = [0, 0, 1, 1]
+        self.cull_margin:int = cull_margin
+        self._shown:set[int] = set()
+        self._viewport:tuple[int,int,int,int] = (0, 0, 0, 0)
+        if spatial_index or (cull_margin is not None):
+            self.spatial_index:SpatialGrid = SpatialGrid()
+        else:
+            self.spatial_index:SpatialGrid = None
         super().__init__(master, **self.parse_kwargs(kwargs))
+        # Scroll by exactly 1 pixel per tcl unit and let us do the clamping
+        super().config(yscrollincrement=1, confine=False)
+        if self.cull_margin is not None:
+            super().bind("<Configure>", self._update_culling, add=True)
+        # Set `self.scroller.momentum` for smooth scrolling
+        scroll_y = lambda pixels: self.yview_scroll(pixels, "units",
+                                                    scale=False)
+        self.scroller:ScrollEngine = ScrollEngine(self, None, scroll_y)
+        WheelDispatcher.get(self).register(self, self.scroller.on_wheel)
 
     def parse_kwargs(self, kwargs) -> None:
         xscrollcommand = kwargs.pop("xscrollcommand", None)
@@ -77,12 +369,176 @@ class BetterCanvas(tk.Canvas):
     configure = config
 
     def bbox(self, what) -> tuple:
-        x1, y1, x2, y2 = super().bbox(what)
-        x1 += self.deltax
-        x2 += self.deltax
-        y1 += self.deltay
-        y2 += self.deltay
-        return (x1, y1, x2, y2)
+        """
+        The items are never moved when scrolling so their coordinates are
+          already relative to the scrollregion (not the viewport).
+        """
+        return super().bbox(what)
+
+    # Keep the spatial index up to date
+    def _items(self, tagOrId:str|int) -> Iterable[int]:
+        if isinstance(tagOrId, int):
+            return (tagOrId,)
+        return super().find_withtag(tagOrId)
+
+    def _create(self, itemType:str, args:tuple, kw:dict) -> int:
+        item:int = super()._create(itemType, args, kw)
+        if self.spatial_index is not None:
+            self._track(item)
+        return item
+
+    def move(self, tagOrId:str|int, xAmount:int, yAmount:int) -> None:
+        super().move(tagOrId, xAmount, yAmount)
+        if self.spatial_index is not None:
+            for item in self._items(tagOrId):
+                if item in self.spatial_index:
+                    self.spatial_index.move(item, xAmount, yAmount)
+                    self._cull_item(item)
+
+    def coords(self, tagOrId:str|int, *args) -> list[float]|None:
+        result = super().coords(tagOrId, *args)
+        if (self.spatial_index is not None) and args:
+            self.reindex(tagOrId)
+        return result
+
+    def moveto(self, tagOrId:str|int, x:int="", y:int="") -> None:
+        super().moveto(tagOrId, x, y)
+        if self.spatial_index is not None:
+            self.reindex(tagOrId)
+
+    def scale(self, tagOrId:str|int, *args) -> None:
+        super().scale(tagOrId, *args)
+        if self.spatial_index is not None:
+            self.reindex(tagOrId)
+
+    def itemconfig(self, tagOrId:str|int, cnf:dict|str=None, **kwargs):
+        result = super().itemconfig(tagOrId, cnf, **kwargs)
+        # `cnf` is a str (or None) when only reading the options
+        if (self.spatial_index is not None) and \
+           (kwargs or isinstance(cnf, dict)):
+            self.reindex(tagOrId)
+        return result
+    itemconfigure = itemconfig
+
+    def insert(self, tagOrId:str|int, *args) -> None:
+        super().insert(tagOrId, *args)
+        if self.spatial_index is not None:
+            self.reindex(tagOrId)
+
+    def dchars(self, tagOrId:str|int, *args) -> None:
+        super().dchars(tagOrId, *args)
+        if self.spatial_index is not None:
+            self.reindex(tagOrId)
+
+    def addtag(self, newtag:str, *args) -> None:
+        super().addtag(newtag, *args)
+        if self.spatial_index is not None:
+            self.reindex(newtag)
+
+    def dtag(self, tagOrId:str|int, *args) -> None:
+        if self.spatial_index is None:
+            return super().dtag(tagOrId, *args)
+        # After this, `tagOrId` might not find the items any more
+        items:tuple[int] = tuple(self._items(tagOrId))
+        super().dtag(tagOrId, *args)
+        for item in items:
+            self._track(item)
+
+    def delete(self, *tagsOrIds:tuple[str|int]) -> None:
+        if self.spatial_index is not None:
+            if "all" in tagsOrIds:
+                self.spatial_index.clear()
+                self._shown.clear()
+            else:
+                for tagOrId in tagsOrIds:
+                    for item in self._items(tagOrId):
+                        self.spatial_index.remove(item)
+                        self._shown.discard(item)
+        super().delete(*tagsOrIds)
+
+    def reindex(self, tagOrId:str|int="all") -> None:
+        """
+        Re-reads the bounding boxes of the items from tcl
+        """
+        for item in self._items(tagOrId):
+            self._track(item)
+
+    def _track(self, item:int) -> None:
+        bbox:tuple[int]|None = super().bbox(item)
+        if bbox is None:
+            self.spatial_index.remove(item)
+            return None
+        self.spatial_index.insert(item, bbox)
+        self._cull_item(item)
+
+    # Queries
+    def find_in_rect(self, x1:int, y1:int, x2:int, y2:int) -> set[int]:
+        """
+        Like `find_overlapping` but done in python using the spatial index
+          (and finds hidden items too). Uses the items' bounding boxes.
+        """
+        assert self.spatial_index is not None, "Pass in spatial_index=True"
+        return self.spatial_index.query(x1, y1, x2, y2)
+
+    def find_at(self, x:int, y:int) -> list[int]:
+        """
+        Returns the items whose bounding box contains (x, y). The last
+          created items are first which is usually the topmost item.
+          Useful for hover detection.
+        """
+        assert self.spatial_index is not None, "Pass in spatial_index=True"
+        return sorted(self.spatial_index.query_point(x, y), reverse=True)
+
+    def get_viewport(self, margin:int=0) -> tuple[int,int,int,int]:
+        x1:int = int(super().canvasx(0)) - margin
+        y1:int = self.deltay - margin
+        x2:int = x1 + super().winfo_width() + 2*margin
+        y2:int = y1 + super().winfo_height() + 2*margin
+        return x1, y1, x2, y2
+
+    def find_visible(self, margin:int=0) -> set[int]:
+        """
+        Returns the items that are inside the viewport (+ margin)
+        """
+        assert self.spatial_index is not None, "Pass in spatial_index=True"
+        return self.spatial_index.query(*self.get_viewport(margin))
+
+    # Culling
+    def _cull_item(self, item:int) -> None:
+        """
+        Shows/hides a single item that was just created/moved
+        """
+        if self.cull_margin is None:
+            return None
+        x1, y1, x2, y2 = self.spatial_index.bboxes[item]
+        vx1, vy1, vx2, vy2 = self._viewport
+        visible:bool = (x1 <= vx2) and (vx1 <= x2) and (vy1 <= y2) and \
+                       (y1 <= vy2)
+        if visible == (item in self._shown):
+            if not visible:
+                super().itemconfig(item, state="hidden")
+            return None
+        if visible:
+            self._shown.add(item)
+            super().itemconfig(item, state="normal")
+        else:
+            self._shown.discard(item)
+            super().itemconfig(item, state="hidden")
+
+    def _update_culling(self, event:tk.Event=None) -> None:
+        """
+        Only the items that enter/leave the viewport (+ `cull_margin`)
+          are changed so the cost depends on the number of visible items
+        """
+        if self.cull_margin is None:
+            return None
+        self._viewport = self.get_viewport(self.cull_margin)
+        shown:set[int] = self.spatial_index.query(*self._viewport)
+        for item in self._shown - shown:
+            super().itemconfig(item, state="hidden")
+        for item in shown - self._shown:
+            super().itemconfig(item, state="normal")
+        self._shown:set[int] = shown
 
     def yview(self, *args) -> (float, float) or None:
         if len(args) == 0:
@@ -135,8 +591,232 @@ class BetterCanvas(tk.Canvas):
         elif pixels < 0:
             pixels = max(pixels, self.scrollregion[1]-self.deltay)
         if pixels != 0:
-            super().move("all", 0, -pixels)
+            # Move the view instead of all of the items
+            tk.Canvas.yview_scroll(self, pixels, "units")
             self.deltay += pixels
+            self._update_culling()
+
+
+class FenwickTree:
+    """
+    A list of ints that can also give you prefix sums and find which
+      item contains a given offset in O(log n). Used for lists of
+      widget sizes where we need the position of the nth widget.
+    Changing an item is O(log n) and appending/popping the last item is
+      O(log n)/O(1) but inserting/popping anywhere else rebuilds the
+      tree in O(n).
+    """
+    __slots__ = "values", "tree"
+
+    def __init__(self, values:Iterable[int]=()) -> FenwickTree:
+        self.rebuild(values)
+
+    def rebuild(self, values:Iterable[int]) -> None:
+        """
+        O(n) construction
+        """
+        self.values:list[int] = list(values)
+        self.tree:list[int] = [0] + self.values
+        for i in range(1, len(self.tree)):
+            j:int = i + (i & -i)
+            if j < len(self.tree):
+                self.tree[j] += self.tree[i]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, idx:int) -> int:
+        return self.values[idx]
+
+    def __setitem__(self, idx:int, value:int) -> None:
+        delta:int = value - self.values[idx]
+        if delta == 0:
+            return None
+        self.values[idx] = value
+        i:int = idx + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def append(self, value:int) -> None:
+        self.insert(len(self.values), value)
+
+    def insert(self, idx:int, value:int) -> None:
+        if idx == len(self.values):
+            # Appending only needs the new node
+            self.values.append(value)
+            i:int = len(self.values)
+            total:int = value
+            low:int = i - (i & -i)
+            j:int = i - 1
+            while j > low:
+                total += self.tree[j]
+                j -= j & -j
+            self.tree.append(total)
+        else:
+            self.values.insert(idx, value)
+            self.rebuild(self.values)
+
+    def pop(self, idx:int=-1) -> int:
+        if idx in (-1, len(self.values)-1):
+            # No other node includes the last one
+            value:int = self.values.pop()
+            self.tree.pop()
+            return value
+        value:int = self.values.pop(idx)
+        self.rebuild(self.values)
+        return value
+
+    def prefix(self, idx:int) -> int:
+        """
+        Returns the sum of the first `idx` values
+        """
+        total:int = 0
+        while idx > 0:
+            total += self.tree[idx]
+            idx -= idx & -idx
+        return total
+
+    def total(self) -> int:
+        return self.prefix(len(self.values))
+
+    def find(self, offset:int) -> int:
+        """
+        Returns the index of the item that contains `offset` (the largest
+          idx such that `self.prefix(idx) <= offset`). All of the values
+          must be >= 0. Clamped to the last item.
+        """
+        idx:int = 0
+        bit:int = 1 << len(self.tree).bit_length()
+        while bit:
+            nxt:int = idx + bit
+            if (nxt < len(self.tree)) and (self.tree[nxt] <= offset):
+                idx:int = nxt
+                offset -= self.tree[nxt]
+            bit >>= 1
+        return min(idx, len(self.values)-1)
+
+
+class LazySection:
+    """
+    A placeholder frame (with an estimated height) inside a `BetterFrame`
+      that is only filled in by `factory(frame)` when it's first scrolled
+      into view. Created by `BetterFrame.add_lazy_section`.
+    """
+    __slots__ = "frame", "factory", "built"
+
+    def __init__(self, frame:tk.Frame,
+                 factory:Function[tk.Frame,None]) -> LazySection:
+        self.factory:Function[tk.Frame,None] = factory
+        self.frame:tk.Frame = frame
+        self.built:bool = False
+
+    def build(self) -> None:
+        if self.built:
+            return None
+        self.built:bool = True
+        # Once the factory adds widgets to the frame, it stops using the
+        #   estimated height and resizes to fit them
+        self.factory(self.frame)
+
+    def is_laid_out(self) -> bool:
+        """
+        Pack only maps the placeholder once it has given it a position.
+          Before that `winfo_y`/`winfo_height` are meaningless.
+        """
+        return bool(self.frame.winfo_ismapped())
+
+    def get_bottom(self) -> int:
+        return self.frame.winfo_y() + self.frame.winfo_height()
+
+
+class ViewportScroller:
+    """
+    Scrolls one axis ("x" or "y") of a `BetterFrame` without scrolling
+      its canvas because tk clamps the coordinates of canvas windows to
+      16 bits (so a frame bigger than 32767 pixels can't be scrolled).
+      The frame is kept the size of the viewport and the scroll position
+      is `self.offset`. The owner must place its children at their
+      position minus `self.offset` when `on_scroll` is called.
+    `get_total()` must return the size of the contents along the axis.
+      A scroll "unit" (from the scrollbar's arrows) is `unit` pixels.
+      Created by `BetterFrame.virtualise`.
+    """
+    __slots__ = "frame", "axis", "get_total", "unit", "on_scroll", "offset"
+
+    def __init__(self, frame:BetterFrame, axis:str,
+                 get_total:Function[int], unit:int,
+                 on_scroll:Function[None]) -> ViewportScroller:
+        assert axis in ("x", "y"), "ValueError"
+        self.get_total:Function[int] = get_total
+        self.on_scroll:Function[None] = on_scroll
+        self.frame:BetterFrame = frame
+        self.axis:str = axis
+        self.unit:int = unit
+        self.offset:int = 0
+
+    def get_view(self) -> int:
+        """
+        Returns the size of the viewport along the axis
+        """
+        if self.axis == "x":
+            return self.frame.dummy_canvas.winfo_width()
+        return self.frame.dummy_canvas.winfo_height()
+
+    def clamp(self) -> int:
+        """
+        Clamps `self.offset` (the contents might have shrunk since the
+          last scroll), updates the scrollbar and returns the offset.
+          Call it before placing the children.
+        """
+        view:int = self.get_view()
+        self.offset:int = max(0, min(self.offset, self.get_total()-view))
+        name:str = "h_scrollbar" if self.axis == "x" else "v_scrollbar"
+        scrollbar:tk.Misc = getattr(self.frame, name, None)
+        if scrollbar is not None:
+            scrollbar.set(*self.view())
+        return self.offset
+
+    def scroll_to(self, offset:int) -> None:
+        """
+        Scrolls so that the pixel `offset` (from the start of the
+          contents) is at the start of the viewport
+        """
+        offset:int = max(0, min(int(offset), self.get_total()-self.get_view()))
+        if offset != self.offset:
+            self.offset:int = offset
+            self.on_scroll()
+
+    def scroll_into_view(self, low:int, high:int) -> None:
+        """
+        Scrolls (as little as possible) so that the pixels from `low` to
+          `high` are visible.
+        """
+        view:int = self.get_view()
+        if low < self.offset:
+            self.scroll_to(low)
+        elif high > self.offset+view:
+            self.scroll_to(high-view)
+
+    def view(self, *args) -> tuple[float,float]|None:
+        """
+        Like `tk.Canvas.xview`/`tk.Canvas.yview` but in terms of
+          `self.offset`
+        """
+        total:int = max(1, self.get_total())
+        view:int = self.get_view()
+        if len(args) == 0:
+            return self.offset/total, min(1.0, (self.offset+view)/total)
+        if args[0] == "moveto":
+            self.scroll_to(float(args[1])*total)
+        elif args[0] == "scroll":
+            if args[2].startswith("page"):
+                pixels:int = int(args[1]) * view
+            else:
+                pixels:int = int(args[1]) * self.unit
+            self.scroll_to(self.offset+pixels)
+        else:
+            raise ValueError(f"Unhandled: {self.axis}view{args}")
 
 
 class BetterFrame(tk.Frame):
@@ -170,6 +850,20 @@ class BetterFrame(tk.Frame):
                  **kwargs):
         assert isinstance(scroll_speed, int), "`scroll_speed` must be an int"
         self.scroll_speed = scroll_speed
+        # Set `self.scroller.momentum` for smooth scrolling
+        self.scroller:ScrollEngine = ScrollEngine(self, self._scroll_x_pixels,
+                                                  self._scroll_y_pixels,
+                                        pixels_per_notch=scroll_speed*SCROLL_UNIT)
+        self._scrollregion:tuple[int,int,int,int] = None
+        self._scrollregion_id:str = None
+        self._always_fit:set[str] = set()
+        self._fit_once:set[str] = set()
+        self._fit_id:str = None
+        self._lazy_sections:list[LazySection] = []
+        self._lazy_id:str = None
+        self.lazy_prefetch:bool = False
+        self._bulk_depth:int = 0
+        self._viewports:dict[str,ViewportScroller] = {}
 
         self.master_frame = tk.Frame(master, bd=bd, bg=bg)
         self.master_frame.grid_rowconfigure(1, weight=1)
@@ -182,27 +876,27 @@ class BetterFrame(tk.Frame):
         if vscroll:
             self.v_scrollbar = VScrollBarClass(self.master_frame,
                                                orient="vertical",
-                                               command=self.dummy_canvas.yview,
+                                               command=self.yview,
                                                **scrollbar_kwargs)
             self.v_scrollbar.grid(row=1, column=2, sticky="news")
-            self.dummy_canvas.configure(yscrollcommand=self.v_scrollbar.set)
+        self.dummy_canvas.configure(yscrollcommand=self._on_yscroll)
         if hscroll:
             self.h_scrollbar = HScrollBarClass(self.master_frame,
                                                orient="horizontal",
-                                               command=self.dummy_canvas.xview,
+                                               command=self.xview,
                                                **scrollbar_kwargs)
             self.h_scrollbar.grid(row=2*(1-hscrolltop), column=1, sticky="news")
-            self.dummy_canvas.configure(xscrollcommand=self.h_scrollbar.set)
+            self.dummy_canvas.configure(xscrollcommand=self._on_xscroll)
 
         # Bind to the mousewheel scrolling
-        self.dummy_canvas.bind_all("<MouseWheel>", self._scroll_windows,
-                                   add=True)
-        self.dummy_canvas.bind_all("<Button-4>", self._scroll_linux, add=True)
-        self.dummy_canvas.bind_all("<Button-5>", self._scroll_linux, add=True)
+        WheelDispatcher.get(self.master_frame).register(self.master_frame,
+                                                        self.scroller.on_wheel)
         self.bind("<Configure>", self._scrollbar_scrolling, add=True)
 
         # Place `self` inside `dummy_canvas`
-        self.dummy_canvas.create_window((0, 0), window=self, anchor="nw")
+        self._window_id:int = self.dummy_canvas.create_window((0, 0),
+                                                              window=self,
+                                                              anchor="nw")
         # Place `dummy_canvas` inside `master_frame`
         self.dummy_canvas.grid(row=1, column=1, sticky="news")
 
@@ -218,8 +912,7 @@ class BetterFrame(tk.Frame):
         Returns the real x value of the (0, 0) coordinate.
         """
         low, high = self.dummy_canvas.xview()
-        x1, _, x2, _ = self.dummy_canvas.cget("scrollregion").split(" ")
-        x1, x2 = int(x1), int(x2)
+        x1, _, x2, _ = self.get_scrollregion()
         low = int(x1 + (x2 - x1)*float(low))
         high = int(x1 + (x2 - x1)*float(high))
         return low, high
@@ -229,8 +922,7 @@ class BetterFrame(tk.Frame):
         Returns the real y value of the (0, 0) coordinate.
         """
         low, high = self.dummy_canvas.yview()
-        _, y1, _, y2 = self.dummy_canvas.cget("scrollregion").split(" ")
-        y1, y2 = int(y1), int(y2)
+        _, y1, _, y2 = self.get_scrollregion()
         low = int(y1 + (y2 - y1)*float(low))
         high = int(y1 + (y2 - y1)*float(high))
         return low, high
@@ -247,62 +939,287 @@ class BetterFrame(tk.Frame):
         """
         return y + self.get_y_offset()[0]
 
-    def _scroll_windows(self, event:tk.Event) -> None:
-        if not self.check_mouse_over_self(event):
-            return None
-        assert event.delta != 0, "On Windows, `event.delta` should never be 0"
-        steps = int(-event.delta/abs(event.delta)*self.scroll_speed)
-        if event.state&1:
-            self.dummy_canvas.xview_scroll(steps, "units")
+    def xscroll_to(self, low:int, high:int) -> None:
+        """
+        Scrolls (as little as possible) so that the x coordinates from
+          `low` to `high` are visible.
+        """
+        viewport:ViewportScroller = self._viewports.get("x", None)
+        if viewport is not None:
+            return viewport.scroll_into_view(low, high)
+        x1, _, x2, _ = self.get_scrollregion()
+        view_low, view_high = self.get_x_offset()
+        if low < view_low:
+            target:int = low
+        elif high > view_high:
+            target:int = high - (view_high-view_low)
         else:
-            self.dummy_canvas.yview_scroll(steps, "units")
-
-    def _scroll_linux(self, event:tk.Event) -> None:
-        if not self.check_mouse_over_self(event):
             return None
-        steps:int = self.scroll_speed
-        if event.num == 4:
-            steps *= -1
-        if event.state&1:
-            self.dummy_canvas.xview_scroll(steps, "units")
-        else:
-            self.dummy_canvas.yview_scroll(steps, "units")
+        self.dummy_canvas.xview_moveto((target-x1)/max(1, x2-x1))
+
+    def xview(self, *args) -> tuple[float,float]|None:
+        """
+        The horizontal scrollbar's command
+        """
+        viewport:ViewportScroller = self._viewports.get("x", None)
+        if viewport is not None:
+            return viewport.view(*args)
+        return self.dummy_canvas.xview(*args)
+
+    def yview(self, *args) -> tuple[float,float]|None:
+        """
+        The vertical scrollbar's command
+        """
+        viewport:ViewportScroller = self._viewports.get("y", None)
+        if viewport is not None:
+            return viewport.view(*args)
+        return self.dummy_canvas.yview(*args)
+
+    def virtualise(self, axis:str, get_total:Function[int], unit:int,
+                   on_scroll:Function[None]) -> ViewportScroller:
+        """
+        Stops scrolling `dummy_canvas` along `axis` and scrolls a
+          `ViewportScroller` instead. Used by classes that place their own
+          children (like `VirtualListFrame`) when the contents can be
+          bigger than tk's 16 bit canvas coordinates. The frame is resized
+          to always fill the canvas.
+        """
+        viewport:ViewportScroller = ViewportScroller(self, axis, get_total,
+                                                     unit, on_scroll)
+        if not self._viewports:
+            self.dummy_canvas.bind("<Configure>", self._fill_canvas, add=True)
+        self._viewports[axis] = viewport
+        return viewport
+
+    def _fill_canvas(self, event:tk.Event) -> None:
+        super().config(width=event.width, height=event.height)
+        for viewport in self._viewports.values():
+            viewport.on_scroll()
+
+    def _scroll_x_pixels(self, pixels:int) -> None:
+        viewport:ViewportScroller = self._viewports.get("x", None)
+        if viewport is not None:
+            return viewport.scroll_to(viewport.offset+pixels)
+        x1, _, x2, _ = self.get_scrollregion()
+        x:float = self.dummy_canvas.canvasx(0) + pixels - x1
+        self.dummy_canvas.xview_moveto(x/max(1, x2-x1))
+
+    def _scroll_y_pixels(self, pixels:int) -> None:
+        viewport:ViewportScroller = self._viewports.get("y", None)
+        if viewport is not None:
+            return viewport.scroll_to(viewport.offset+pixels)
+        _, y1, _, y2 = self.get_scrollregion()
+        y:float = self.dummy_canvas.canvasy(0) + pixels - y1
+        self.dummy_canvas.yview_moveto(y/max(1, y2-y1))
 
     def check_mouse_over_self(self, event:tk.Event) -> bool:
         return str(event.widget).startswith(str(self.master_frame))
 
-    def _scrollbar_scrolling(self, event:tk.Event) -> None:
-        region = list(self.dummy_canvas.bbox("all"))
+    def _on_xscroll(self, low:str, high:str) -> None:
+        # Virtualised axes update their scrollbar in `ViewportScroller.clamp`
+        if "x" not in self._viewports:
+            self.h_scrollbar.set(low, high)
+
+    def _on_yscroll(self, low:str, high:str) -> None:
+        if "y" in self._viewports:
+            return None
+        v_scrollbar = getattr(self, "v_scrollbar", None)
+        if v_scrollbar is not None:
+            v_scrollbar.set(low, high)
+        if self._lazy_sections:
+            self._schedule_lazy_check()
+
+    def add_lazy_section(self, factory:Function[tk.Frame,None], height:int,
+                         **pack_kwargs:dict) -> LazySection:
+        """
+        Packs (at the bottom of this frame) a placeholder frame that is
+          `height` pixels tall. `factory(frame)` is called to fill it in
+          when it first becomes visible. Don't mix this with grid/place
+          or with packing other widgets after the lazy sections.
+        If `self.lazy_prefetch` is `True`, the sections in the next screen
+          (below the visible ones) are also built, one per idle cycle.
+        """
+        frame:tk.Frame = tk.Frame(self, height=height, bg=self.cget("bg"),
+                                  highlightthickness=0, bd=0)
+        pack_kwargs.setdefault("fill", "x")
+        frame.pack(side="top", **pack_kwargs)
+        section:LazySection = LazySection(frame, factory)
+        self._lazy_sections.append(section)
+        # The placeholder's position is only known once pack has placed
+        #   (and mapped) it which is when it gets its first <Configure>
+        frame.bind("<Configure>", lambda e: self._schedule_lazy_check(),
+                   add=True)
+        return section
+
+    def _schedule_lazy_check(self) -> None:
+        if self._lazy_id is None:
+            self._lazy_id:str = super().after_idle(self._lazy_check)
+
+    def _first_lazy_section_below(self, y:int) -> int:
+        """
+        Binary search for the first section (that hasn't been built)
+          whose bottom is below `y`. Works because the sections are
+          packed from top to bottom.
+        """
+        low, high = 0, len(self._lazy_sections)
+        while low < high:
+            mid:int = (low+high) // 2
+            if self._lazy_sections[mid].get_bottom() < y:
+                low:int = mid + 1
+            else:
+                high:int = mid
+        return low
+
+    def _lazy_check(self) -> None:
+        self._lazy_id:str = None
+        top:int = int(self.dummy_canvas.canvasy(0))
+        height:int = self.dummy_canvas.winfo_height()
+        bottom:int = top + height
+        idx:int = self._first_lazy_section_below(top)
+        built:bool = False
+        while idx < len(self._lazy_sections):
+            section:LazySection = self._lazy_sections[idx]
+            if not section.is_laid_out():
+                # Its <Configure> will call us again once it's placed
+                return None
+            if section.frame.winfo_y() > bottom:
+                break
+            self._lazy_sections.pop(idx)
+            section.build()
+            built:bool = True
+        if built or (not self.lazy_prefetch) or (not self._lazy_sections):
+            return None
+        # Nothing to build on screen so prefetch 1 section from the next
+        #   screen and check again in the next idle cycle
+        if idx < len(self._lazy_sections):
+            section:LazySection = self._lazy_sections[idx]
+            if not section.is_laid_out():
+                return None
+            if section.frame.winfo_y() <= bottom+height:
+                self._lazy_sections.pop(idx)
+                section.build()
+                self._schedule_lazy_check()
+
+    def get_scrollregion(self) -> tuple[int,int,int,int]:
+        """
+        Returns the cached scrollregion of `dummy_canvas` (computing it
+          if it hasn't been computed yet)
+        """
+        if self._scrollregion is None:
+            self._update_scrollregion()
+        return self._scrollregion
+
+    @contextmanager
+    def bulk_add(self) -> Iterator[BetterFrame]:
+        """
+        Use this when adding lots of widgets at once:
+            with frame.bulk_add():
+                for i in range(5000):
+                    tk.Label(frame, text=i).pack()
+        While inside, the frame doesn't propagate its geometry, it's
+          hidden inside the canvas and the scrollregion isn't updated.
+          On exit, there is a single layout pass and a single
+          scrollregion update. Can be nested.
+        """
+        self._bulk_depth += 1
+        if self._bulk_depth == 1:
+            pack_propagate:bool = super().pack_propagate()
+            grid_propagate:bool = super().grid_propagate()
+            super().pack_propagate(False)
+            super().grid_propagate(False)
+            self.dummy_canvas.itemconfig(self._window_id, state="hidden")
+        try:
+            yield self
+        finally:
+            self._bulk_depth -= 1
+            if self._bulk_depth == 0:
+                super().pack_propagate(pack_propagate)
+                super().grid_propagate(grid_propagate)
+                self.dummy_canvas.itemconfig(self._window_id, state="normal")
+                self._scrollbar_scrolling()
+
+    def _scrollbar_scrolling(self, event:tk.Event=None) -> None:
+        """
+        Called on each <Configure> of the frame. Packing lots of children
+          in a loop causes lots of these so only update the scrollregion
+          once per idle cycle.
+        """
+        if self._bulk_depth > 0:
+            return None
+        if self._scrollregion_id is None:
+            self._scrollregion_id:str = super().after_idle(
+                                                   self._update_scrollregion)
+        if self._always_fit:
+            self._schedule_fit()
+        if self._lazy_sections:
+            self._schedule_lazy_check()
+
+    def _update_scrollregion(self) -> None:
+        if self._scrollregion_id is not None:
+            super().after_cancel(self._scrollregion_id)
+            self._scrollregion_id:str = None
+        region = list(self.dummy_canvas.bbox("all") or (0, 0, 1, 1))
         region[2] = max(self.dummy_canvas.winfo_width(), region[2])
         region[3] = max(self.dummy_canvas.winfo_height(), region[3])
-        self.dummy_canvas.configure(scrollregion=region)
+        region:tuple[int,int,int,int] = tuple(region)
+        if region != self._scrollregion:
+            self._scrollregion:tuple[int,int,int,int] = region
+            self.dummy_canvas.configure(scrollregion=region)
 
     def resize(self, fit:str=None, height:int=None, width:int=None) -> None:
         """
         Resizes the frame to fit the widgets inside. You must either
         specify (the `fit`) or (the `height` or/and the `width`) parameter.
         Parameters:
-            fit:str       `fit` can be either `FIT_WIDTH` or `FIT_HEIGHT`.
+            fit:str       `fit` can be either `FIT_WIDTH`, `FIT_HEIGHT`,
+                          `ALWAYS_FIT_WIDTH` or `ALWAYS_FIT_HEIGHT`.
                           `FIT_WIDTH` makes sure that the frame's width can
                            fit all of the widgets. `FIT_HEIGHT` is simmilar
+                          `ALWAYS_FIT_WIDTH` keeps doing `FIT_WIDTH` each
+                           time the widgets inside change size until a
+                           `width` is passed in. `ALWAYS_FIT_HEIGHT` is
+                           simmilar
             height:int     specifies the height of the frame in pixels
             width:int      specifies the width of the frame in pixels
-        To do:
-            ALWAYS_FIT_WIDTH
-            ALWAYS_FIT_HEIGHT
+        The fitting is done (at most once per idle cycle) after tkinter
+        has worked out the size of the widgets inside.
         """
         if height is not None:
+            self._always_fit.discard(ALWAYS_FIT_HEIGHT)
             self.dummy_canvas.config(height=height)
         if width is not None:
+            self._always_fit.discard(ALWAYS_FIT_WIDTH)
             self.dummy_canvas.config(width=width)
-        if fit == FIT_WIDTH:
-            super().update()
-            self.dummy_canvas.config(width=super().winfo_width())
-        if fit == FIT_HEIGHT:
-            super().update()
-            self.dummy_canvas.config(height=super().winfo_height())
+        if fit in (FIT_WIDTH, FIT_HEIGHT):
+            self._fit_once.add(fit)
+            self._schedule_fit()
+        elif fit in (ALWAYS_FIT_WIDTH, ALWAYS_FIT_HEIGHT):
+            self._always_fit.add(fit)
+            self._schedule_fit()
+        elif fit is not None:
+            raise ValueError(f"Unknown value for fit: {fit!r}")
     fit = resize
 
+    def _schedule_fit(self) -> None:
+        if self._fit_id is None:
+            self._fit_id:str = super().after_idle(self._apply_fit)
+
+    def _apply_fit(self) -> None:
+        self._fit_id:str = None
+        fits:set[str] = self._always_fit | self._fit_once
+        self._fit_once.clear()
+        kwargs:dict[str,int] = {}
+        if fits & {FIT_WIDTH, ALWAYS_FIT_WIDTH}:
+            kwargs["width"] = super().winfo_reqwidth()
+        if fits & {FIT_HEIGHT, ALWAYS_FIT_HEIGHT}:
+            kwargs["height"] = super().winfo_reqheight()
+        # Only touch the canvas if its size actually needs to change
+        for key, value in tuple(kwargs.items()):
+            if int(self.dummy_canvas.cget(key)) == value:
+                kwargs.pop(key)
+        if kwargs:
+            self.dummy_canvas.config(**kwargs)
+
     def bind(self, sequence:str, callback, *args, **kwargs) -> tuple[str]:
         b1:str = self.master_frame.bind(sequence, callback, *args, **kwargs)
         b2:str = self.dummy_canvas.bind(sequence, callback, *args, **kwargs)
@@ -310,6 +1227,120 @@ class BetterFrame(tk.Frame):
         return b1, b2, b3
 
 
+class VirtualListFrame(BetterFrame):
+    """
+    A `BetterFrame` that shows `row_count` rows but only keeps the
+      visible rows (plus `overscan` rows on each side) alive. Rows that
+      are scrolled out of view are reused for the rows that are scrolled
+      into view.
+    `row_factory(frame)` must create (but not pack/grid/place) a new row
+      widget. `row_binder(widget, idx)` must change the widget so that it
+      shows row `idx`.
+    Rows can have different heights. Rows that haven't been shown yet
+      are assumed to be `estimated_height` pixels high. The heights are
+      kept in a `FenwickTree` so finding the rows that are visible
+      is O(log n).
+    The y axis is scrolled by `self.viewport` (a `ViewportScroller`) so
+      there can be more than 32767 pixels of rows.
+
+    def factory(frame:VirtualListFrame) -> tk.Label:
+        return tk.Label(frame, anchor="w")
+    def binder(label:tk.Label, idx:int) -> None:
+        label.config(text=f"Row number {idx}")
+    frame = VirtualListFrame(root, 100_000, factory, binder, height=200)
+    """
+    def __init__(self, master:tk.Misc, row_count:int,
+                 row_factory:Function[VirtualListFrame,tk.Misc],
+                 row_binder:Function[tk.Misc,int,None],
+                 estimated_height:int=20, overscan:int=5, **kwargs):
+        assert kwargs.get("vscroll", True), "VirtualListFrame needs vscroll"
+        self.row_factory:Function[VirtualListFrame,tk.Misc] = row_factory
+        self.row_binder:Function[tk.Misc,int,None] = row_binder
+        self.estimated_height:int = estimated_height
+        self.overscan:int = overscan
+        self.heights:FenwickTree = FenwickTree([estimated_height]*row_count)
+        self._rows:dict[int,tk.Misc] = {}
+        self._free:list[tk.Misc] = []
+        self._refresh_id:str = None
+        super().__init__(master, **kwargs)
+        self.viewport:ViewportScroller = self.virtualise("y",
+                                                         self.heights.total,
+                                                         estimated_height,
+                                                         self._schedule_refresh)
+
+    def set_row_count(self, row_count:int) -> None:
+        """
+        Changes the number of rows and rebinds all of the visible rows
+        """
+        values:list[int] = self.heights.values[:row_count]
+        values.extend([self.estimated_height]*(row_count-len(values)))
+        self.heights.rebuild(values)
+        self.refresh_rows()
+
+    def refresh_rows(self) -> None:
+        """
+        Call this if the data behind the rows changes. All of the visible
+          rows are released and rebound.
+        """
+        for idx in tuple(self._rows):
+            self._release(idx)
+        self._schedule_refresh()
+
+    def see(self, idx:int) -> None:
+        """
+        Scrolls so that row `idx` is at the top
+        """
+        self.viewport.scroll_to(self.heights.prefix(idx))
+
+    def _schedule_refresh(self) -> None:
+        if self._refresh_id is None:
+            self._refresh_id:str = super().after_idle(self._refresh)
+
+    def _release(self, idx:int) -> None:
+        widget:tk.Misc = self._rows.pop(idx)
+        widget.place_forget()
+        self._free.append(widget)
+
+    def _refresh(self) -> None:
+        """
+        Works out which rows are visible, recycles the rest and places
+          the visible ones.
+        """
+        self._refresh_id:str = None
+        top:int = self.viewport.clamp()
+        if len(self.heights) == 0:
+            for idx in tuple(self._rows):
+                self._release(idx)
+            return None
+        bottom:int = top + self.viewport.get_view()
+        first:int = max(0, self.heights.find(top)-self.overscan)
+        last:int = min(len(self.heights)-1,
+                       self.heights.find(bottom)+self.overscan)
+        for idx in tuple(self._rows):
+            if not (first <= idx <= last):
+                self._release(idx)
+        changed:bool = False
+        for idx in range(first, last+1):
+            widget:tk.Misc = self._rows.get(idx, None)
+            if widget is None:
+                if self._free:
+                    widget:tk.Misc = self._free.pop()
+                else:
+                    widget:tk.Misc = self.row_factory(self)
+                self.row_binder(widget, idx)
+                self._rows[idx] = widget
+            height:int = widget.winfo_reqheight()
+            if height != self.heights[idx]:
+                self.heights[idx] = height
+                changed:bool = True
+        for idx, widget in self._rows.items():
+            widget.place(x=0, y=self.heights.prefix(idx)-top,
+                         relwidth=1, height=self.heights[idx])
+        if changed:
+            # The rows might have moved. Check again once they are placed
+            self._schedule_refresh()
+
+
 # Example 1
 if __name__ == "__main__":
     root = tk.Tk()
@@ -345,4 +1376,19 @@ if __name__ == "__main__":
         label.pack(anchor="w")
     frame2.resize(FIT_WIDTH)
 
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
+
+# Example 3
+if __name__ == "__main__":
+    def factory(frame:VirtualListFrame) -> tk.Label:
+        return tk.Label(frame, anchor="w", bg="black", fg="white")
+
+    def binder(label:tk.Label, idx:int) -> None:
+        # Every 10th row is taller to show variable height rows
+        label.config(text=f"Label number {idx}", pady=10*(idx%10 == 0))
+
+    root = tk.Tk()
+    frame = VirtualListFrame(root, 100_000, factory, binder, width=300,
+                             height=200, bg="black")
+    frame.pack(fill="both", expand=True)
+    root.mainloop()
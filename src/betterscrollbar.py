@@ -1,15 +1,20 @@
 # Partialy taken from @BryanOakley's answer here:
 # https://stackoverflow.com/a/57350295/11106801
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
 import tkinter as tk
 
 DEBUG:bool = False
+# How close 2 xview fractions must be for `ScrollGroup` to treat them as
+#   the same position
+X_TOLERANCE:float = 1e-3
 
 
 class BaseBetterScrollBar(tk.Canvas):
     __slots__ = "_thumb_colour", "_active_thumb_colour", "_thumb_colour", \
                 "_command", "_thumb", "_mouse_pressed", "_p0", "_p1", \
-                "_grid_kwargs", "_shown", "hide", "_offset", "_height", \
-                "_width", "_height", "_high", "_low"
+                "_shown", "hide", "_offset", "_height", \
+                "_width", "_height", "_high", "_low", "_drawn", "_set_id"
 
     def __init__(self, master:tk.Misc, thickness:int=12, can_hide:bool=False,
                  thumb_colour:str="#555555", active_thumb_colour:str="#777777",
@@ -22,9 +27,8 @@ class BaseBetterScrollBar(tk.Canvas):
         self._command = command
         # For dragding
         self._mouse_pressed:bool = False
-        # Hide/Show
-        self._grid_kwargs:dict = None
-        self._shown:bool = True
+        # Hide/Show (`_shown` is None while grid isn't managing us)
+        self._shown:bool|None = None
         self.hide:bool = False
         self._offset:int = 0
         # For calculations
@@ -34,6 +38,9 @@ class BaseBetterScrollBar(tk.Canvas):
         self._low:float = 0
         self._p0:int = 0
         self._p1:int = 0
+        # For skipping/coalescing redraws
+        self._drawn:tuple[int] = None
+        self._set_id:str = None
         # Create thumb
         self._thumb = super().create_rectangle(0, 0, 1, 1, outline="",
                                                fill=self._thumb_colour)
@@ -102,37 +109,55 @@ class BaseBetterScrollBar(tk.Canvas):
 
     def _recalc_redraw(self) -> None:
         """
-        Re-calculates and redraws the thumb
+        Re-calculates and redraws the thumb. The redraw is skipped if the
+        thumb wouldn't move.
         """
         self._recalculate()
+        drawn:tuple[int] = (self._p0, self._p1, self._width, self._height)
+        if drawn == self._drawn:
+            return None
+        self._drawn:tuple[int] = drawn
         self._redraw()
 
     def set(self, low:str, high:str) -> None:
-        low, high = float(low), float(high)
-        self._low, self._high = low, high
-        if self.hide:
-            if self._shown:
-                if (low == 0) and (high == 1):
-                    self._grid_kwargs = super().grid_info()
-                    self.grid_forget()
-                    return None
-            else:
-                if (low != 0) or (high != 1):
-                    if self._grid_kwargs is not None:
-                        self.grid(**self._grid_kwargs)
-                    return None
+        """
+        Called by the scrolled widget (its `xscrollcommand`/`yscrollcommand`).
+        Only stores the values. The actual work is done at most once per
+        idle cycle by `_idle_set` no matter how many times this is called.
+        """
+        self._low, self._high = float(low), float(high)
+        if self._set_id is None:
+            self._set_id:str = super().after_idle(self._idle_set)
+
+    def _idle_set(self) -> None:
+        self._set_id:str = None
+        if self.hide and (self._shown is not None):
+            # Only the last (low, high) pair of the burst decides if the
+            #   scrollbar should be shown so it can't flicker
+            full:bool = (self._low <= 0) and (self._high >= 1)
+            if self._shown and full:
+                self.grid_remove()
+                return None
+            if (not self._shown) and (not full):
+                # Tk remembers the grid options after `grid_remove`
+                self.grid()
+                return None
         self._recalc_redraw()
 
-    def grid(self, **kwargs:dict) -> None:
-        self._grid_kwargs:dict = kwargs
+    def grid(self, cnf:dict={}, **kwargs:dict) -> None:
         self._shown:bool = True
-        super().grid(**kwargs)
+        super().grid(cnf, **kwargs)
         self._recalc_redraw()
+    grid_configure = grid
 
     def grid_forget(self) -> None:
-        self._shown:bool = False
+        self._shown:bool|None = None
         super().grid_forget()
 
+    def grid_remove(self) -> None:
+        self._shown:bool = False
+        super().grid_remove()
+
     def pack(self, **kwargs) -> None:
         if self.hide:
             raise NotImplementedError("Hide only works with grid")
@@ -179,13 +204,84 @@ class BetterScrollBarHorizontal(BaseBetterScrollBar):
 
 
 class BetterScrollBarVertical(BaseBetterScrollBar):
-    __slots__ = ()
+    """
+    Can also show an overview ruler (like modern editors) using
+      `set_markers`. All of the markers are bucketed into trough pixels
+      and drawn as a single image so the number of markers doesn't
+      change the number of canvas items.
+    """
+    __slots__ = "_markers", "_markers_image", "_markers_item", \
+                "_markers_size"
+    MARKER_HEIGHT:int = 2
 
     def __init__(self, master:tk.Misc, orient:str="vertical", **kwargs):
         if orient != "vertical":
             raise ValueError("Invalid orient for a horizontal scroll bar")
+        self._markers:dict[str,tuple[tuple[float],str]] = {}
+        self._markers_image:tk.PhotoImage = None
+        self._markers_item:int = None
+        self._markers_size:tuple[int,int] = None
         super().__init__(master, **kwargs)
 
+    def set_markers(self, name:str, positions:Iterable[float],
+                    colour:str="yellow") -> None:
+        """
+        Sets the overview markers called `name` (for example "search" or
+          "errors"). `positions` are fractions of the whole document
+          (like the values passed to `set`). Markers added later are drawn
+          on top of older ones.
+        """
+        # Stored as a tuple because they are used again on each resize
+        self._markers[name] = (tuple(positions), colour)
+        self._render_markers()
+
+    def clear_markers(self, name:str=None) -> None:
+        if name is None:
+            self._markers.clear()
+        else:
+            self._markers.pop(name, None)
+        self._render_markers()
+
+    def _on_resize(self, event:tk.Event) -> None:
+        super()._on_resize(event)
+        if self._markers_size != (self._width, self._height):
+            self._render_markers()
+
+    def _render_markers(self) -> None:
+        """
+        Buckets all of the markers into rows of pixels and draws the
+          rows (merged into runs) on `_markers_image`
+        """
+        self._markers_size:tuple[int,int] = (self._width, self._height)
+        if self._markers_image is None:
+            if len(self._markers) == 0:
+                return None
+            self._markers_image = tk.PhotoImage(master=self)
+            self._markers_item:int = super().create_image(0, 0, anchor="nw",
+                                                   image=self._markers_image)
+            # The thumb must stay visible on top of the markers
+            super().tag_lower(self._markers_item)
+        self._markers_image.blank()
+        width, height = self._width, self._height
+        if (width < 1) or (height < self.MARKER_HEIGHT):
+            return None
+        self._markers_image.config(width=width, height=height)
+        scale:int = height - self.MARKER_HEIGHT
+        for positions, colour in self._markers.values():
+            rows:list[int] = sorted({min(scale, max(0, int(p*scale+0.5)))
+                                     for p in positions})
+            start:int = None
+            end:int = None
+            for row in rows:
+                if (start is not None) and (row <= end):
+                    end:int = row + self.MARKER_HEIGHT
+                    continue
+                if start is not None:
+                    self._markers_image.put(colour, to=(0, start, width, end))
+                start, end = row, row+self.MARKER_HEIGHT
+            if start is not None:
+                self._markers_image.put(colour, to=(0, start, width, end))
+
     def _redraw(self) -> None:
         super().coords(self._thumb, 0, self._p0, self._width, self._p1)
 
@@ -201,7 +297,7 @@ class ScrolledText:
 
     def __init__(self, master:tk.Misc, text_widget:tk.Text, vscroll:bool=True,
                  hscroll:bool=False, lines_numbers:bool=False,
-                 line_numbers_width:int=32):
+                 line_numbers_width:int=None):
         self.assert_assertions(master, text_widget)
         self.text_widget:tk.Text = text_widget
         master.grid_rowconfigure(0, weight=1)
@@ -233,13 +329,108 @@ class ScrolledText:
                                "widget inside it.")
 
 
+# Maps a font's actual attributes (`font actual`) to the width of its widest
+#   digit so that we only have to measure once per font instead of once per
+#   redraw. Using the attributes (not the name) means that reconfiguring a
+#   named font gives a new key.
+DIGIT_WIDTHS:dict[tuple[str],int] = {}
+
+
+def get_digit_width(widget:tk.Misc, font:str) -> int:
+    """
+    Returns the advance (in pixels) of the widest digit in `font`.
+    The result is cached in `DIGIT_WIDTHS`.
+    """
+    key:tuple[str] = widget.tk.splitlist(widget.tk.call("font", "actual",
+                                                        font))
+    width:int = DIGIT_WIDTHS.get(key, None)
+    if width is None:
+        measure = lambda char: int(widget.tk.call("font", "measure", font,
+                                                  char))
+        width:int = max(map(measure, "0123456789"))
+        DIGIT_WIDTHS[key] = width
+    return width
+
+
+class GutterMarkers:
+    """
+    Stores the lines that have a marker (breakpoints, diff markers, lint
+      diagnostics, ...) as sorted lists (one per marker name) so that
+      bulk updates are one list rebuild and looking up the markers inside
+      the visible window is 2 bisects.
+    """
+    __slots__ = "lines", "styles", "priorities"
+
+    def __init__(self) -> GutterMarkers:
+        self.lines:dict[str,list[int]] = {}
+        self.styles:dict[str,dict] = {}
+        self.priorities:dict[str,int] = {}
+
+    def config(self, name:str, priority:int=0, **style:dict) -> None:
+        self.lines.setdefault(name, [])
+        self.styles.setdefault(name, {}).update(style)
+        self.priorities[name] = priority
+
+    def set(self, name:str, lines:Iterable[int]) -> None:
+        assert name in self.lines, "Call LineNumbers.marker_config first"
+        self.lines[name] = sorted(set(lines))
+
+    def add(self, name:str, lines:Iterable[int]) -> None:
+        assert name in self.lines, "Call LineNumbers.marker_config first"
+        self.lines[name] = sorted(set(self.lines[name]).union(lines))
+
+    def clear(self, name:str, start:int, end:int) -> None:
+        array:list[int] = self.lines[name]
+        del array[bisect_left(array, start):bisect_right(array, end)]
+
+    def in_range(self, start:int, end:int) -> dict[int,str]:
+        """
+        Returns a dict mapping each line in [start, end] to the name of
+          the marker with the highest priority on that line.
+        """
+        output:dict[int,str] = {}
+        for name, array in self.lines.items():
+            priority:int = self.priorities[name]
+            for i in range(bisect_left(array, start), bisect_right(array, end)):
+                line:int = array[i]
+                old:str = output.get(line, None)
+                if (old is None) or (self.priorities[old] < priority):
+                    output[line] = name
+        return output
+
+
 class LineNumbers(tk.Canvas):
-    def __init__(self, master:tk.Misc, width:int=32, **kwargs):
+    PADX:int = 4
+    SEPARATOR_PADX:int = 5
+    MARKER_WIDTH:int = 10
+    MARKER_SHAPES:dict[str,str] = dict(dot="oval", bar="rectangle")
+
+    def __init__(self, master:tk.Misc, width:int=None, relative:bool=False,
+                 min_digits:int=1, **kwargs):
+        """
+        If `width` is `None`, the gutter resizes itself to fit the largest
+          visible line number. Otherwise it's fixed at `width` pixels (plus
+          `MARKER_WIDTH` once a marker type is configured).
+        If `relative` is `True`, all of the lines (except the one with the
+          insert mark) show their distance from the insert mark.
+        """
         super().__init__(master, bd=0, highlightthickness=0, bg="black",
-                         width=width, **kwargs)
+                         width=32 if width is None else width, **kwargs)
         self.text_widget:ScrolledText = None
         self.last_redrawn:tuple[int] = None
-        self.width:int = width
+        self.auto_width:bool = width is None
+        self.width:int = 32 if width is None else width
+        self.min_digits:int = min_digits
+        self.relative:bool = relative
+        self.digit_width:int = 0
+        self.line_height:int = 0
+        self.digits:int = 0
+        # Annotations
+        self.markers:GutterMarkers = GutterMarkers()
+        self.marker_width:int = 0
+        self._marker_pool:dict[str,list[int]] = {"dot":[], "bar":[]}
+        self._marker_pool_used:dict[str,int] = {"dot":0, "bar":0}
+        self._markers_redraw_id:str = None
 
     def attach(self, text_widget:ScrolledText) -> None:
         if self.text_widget is not None:
@@ -263,6 +454,68 @@ class LineNumbers(tk.Canvas):
 
         self.redraw_loop()
 
+    def set_relative(self, relative:bool) -> None:
+        self.relative:bool = relative
+        self.last_redrawn:tuple[int] = None
+        self.redraw()
+
+    def marker_config(self, name:str, colour:str="red", shape:str="dot",
+                      priority:int=0) -> None:
+        """
+        Creates/changes a marker type. `shape` can be "dot" (breakpoints,
+          lint diagnostics) or "bar" (diff markers). If a line has more
+          than one marker, the one with the highest `priority` is shown.
+        """
+        assert shape in self.MARKER_SHAPES, "ValueError"
+        self.markers.config(name, priority=priority, colour=colour,
+                            shape=shape)
+        if self.marker_width == 0:
+            self.marker_width:int = self.MARKER_WIDTH
+            if self.auto_width:
+                self.digits:int = 0 # Force `_resize_for` to resize the gutter
+            else:
+                # Make room for the markers on the left of the numbers
+                self._set_width(self.width+self.marker_width)
+        self._schedule_markers_redraw()
+
+    def marker_set(self, name:str, lines:Iterable[int]) -> None:
+        """
+        Replaces all of the lines marked with `name` with `lines`
+        """
+        self.markers.set(name, lines)
+        self._schedule_markers_redraw()
+
+    def marker_add(self, name:str, start:int, end:int=None) -> None:
+        """
+        Marks all of the lines from `start` to `end` (inclusive) with `name`
+        """
+        self.markers.add(name, range(start, (start if end is None else end)+1))
+        self._schedule_markers_redraw()
+
+    def marker_clear(self, name:str=None, start:int=1,
+                     end:int=float("inf")) -> None:
+        """
+        Removes `name` (or all markers if `name` is `None`) from the
+          lines from `start` to `end` (inclusive)
+        """
+        names:Iterable[str] = self.markers.lines if name is None else (name,)
+        for name in names:
+            self.markers.clear(name, start, end)
+        self._schedule_markers_redraw()
+
+    def _schedule_markers_redraw(self) -> None:
+        """
+        Coalesces all of the marker changes in the same event into a single
+          redraw of the visible window
+        """
+        if self._markers_redraw_id is None:
+            self._markers_redraw_id:str = super().after_idle(self._markers_redraw)
+
+    def _markers_redraw(self) -> None:
+        self._markers_redraw_id:str = None
+        self.last_redrawn:tuple[int] = None
+        self.redraw()
+
     def redraw_loop(self) -> None:
         try:
             self.redraw()
@@ -285,38 +538,298 @@ class LineNumbers(tk.Canvas):
         self.redraw()
         return result
 
+    def _check_font(self, line_height:int) -> None:
+        """
+        Changing the text widget's font (or the named font that it uses)
+          changes the height of its lines so only then re-measure the
+          digits.
+        """
+        if line_height == self.line_height:
+            return None
+        self.line_height:int = line_height
+        self.font:str = self.text_widget.cget("font")
+        digit_width:int = get_digit_width(self, self.font)
+        if digit_width != self.digit_width:
+            self.digit_width:int = digit_width
+            self.digits:int = 0 # Force `_resize_for` to resize the gutter
+
+    def _resize_for(self, last_line:int) -> None:
+        """
+        Resizes the gutter so that `last_line` fits. Only touches the
+          canvas when the number of digits changes.
+        """
+        if not self.auto_width:
+            return None
+        digits:int = max(self.min_digits, len(str(last_line)))
+        if digits == self.digits:
+            return None
+        self.digits:int = digits
+        self._set_width(digits*self.digit_width + self.PADX +
+                        self.SEPARATOR_PADX + self.marker_width)
+
+    def _set_width(self, width:int) -> None:
+        self.width:int = width
+        super().config(width=width)
+        coords:list[float] = super().coords("separator")
+        # The separator is only created by `attach`
+        if coords:
+            _, y1, _, y2 = coords
+            super().coords("separator", width-3, y1, width-3, y2)
+
     def redraw(self, event:tk.Event=None) -> None:
         if self.text_widget is None:
-            pass
+            return None
 
-        i:str = self.text_widget.index(f"@0,{self.text_widget.winfo_height()}")
-        redraw_state_end:tuple[int] = self.text_widget.dlineinfo(i)
-        i:str = self.text_widget.index("@0,0")
-        redraw_state_start:tuple[int] = self.text_widget.dlineinfo(i)
-        redraw_state:tuple[int] = (redraw_state_start[1], redraw_state_start[3],
+        last:str = self.text_widget.index(f"@0,{self.text_widget.winfo_height()}")
+        redraw_state_end:tuple[int] = self.text_widget.dlineinfo(last)
+        first:str = self.text_widget.index("@0,0")
+        redraw_state_start:tuple[int] = self.text_widget.dlineinfo(first)
+        if (redraw_state_start is None) or (redraw_state_end is None):
+            return None
+        first_line:int = int(first.split(".")[0])
+        last_line:int = int(last.split(".")[0])
+        # Only ask for the insert mark once per redraw (not once per line)
+        if self.relative:
+            insert_line:int = int(self.text_widget.index("insert").split(".")[0])
+        else:
+            insert_line:int = 0
+        redraw_state:tuple[int] = (first_line, last_line, insert_line,
+                                   redraw_state_start[1], redraw_state_start[3],
                                    redraw_state_end[1], redraw_state_end[3])
         if redraw_state == self.last_redrawn:
             return None
         else:
             self.last_redrawn:tuple[int] = redraw_state
 
+        self._check_font(redraw_state_start[3])
+        self._resize_for(last_line)
         super().delete("lines")
-        while True:
-            dline = self.text_widget.dlineinfo(i)
+        visible:dict[int,tuple[int,int]] = {}
+        for line in range(first_line, last_line+1):
+            # If the top display line is the wrapped continuation of a line,
+            #   "{line}.0" isn't visible (`dlineinfo` would return None)
+            index:str = first if line == first_line else f"{line}.0"
+            dline = self.text_widget.dlineinfo(index)
             if dline is None:
-                break
-            text:int = super().create_text(self.width-5, dline[1], anchor="nw",
-                                           font=self.font, text=int(float(i)),
-                                           fill=self.fg, tags=("lines", ))
+                continue
+            visible[line] = (dline[1], dline[3])
+            if self.relative and (line != insert_line):
+                text:int = abs(line-insert_line)
+            else:
+                text:int = line
+            super().create_text(self.width-self.SEPARATOR_PADX, dline[1],
+                                anchor="ne", font=self.font, text=text,
+                                fill=self.fg, tags=("lines", ))
+        self._redraw_markers(first_line, last_line, visible)
+
+    def _redraw_markers(self, first_line:int, last_line:int,
+                        visible:dict[int,tuple[int,int]]) -> None:
+        """
+        Draws the markers for the visible lines reusing the canvas items
+          from `self._marker_pool`. Items that aren't needed are hidden.
+        """
+        if self.marker_width == 0:
+            return None
+        used:dict[str,int] = {shape:0 for shape in self._marker_pool}
+        markers:dict[int,str] = self.markers.in_range(first_line, last_line)
+        for line, name in markers.items():
+            if line not in visible:
+                continue
+            y, height = visible[line]
+            style:dict = self.markers.styles[name]
+            shape:str = style["shape"]
+            pool:list[int] = self._marker_pool[shape]
+            if used[shape] == len(pool):
+                create = getattr(self, "create_"+self.MARKER_SHAPES[shape])
+                pool.append(create(0, 0, 1, 1, outline="",
+                                   tags=("markers",)))
+            item:int = pool[used[shape]]
+            used[shape] += 1
+            if shape == "bar":
+                coords:tuple[int] = (1, y, 4, y+height)
+            else:
+                size:int = min(height, self.marker_width) - 4
+                top:int = y + (height-size)//2
+                coords:tuple[int] = (2, top, 2+size, top+size)
+            super().coords(item, *coords)
+            super().itemconfig(item, fill=style["colour"], state="normal")
+        for shape, pool in self._marker_pool.items():
+            for item in pool[used[shape]:self._marker_pool_used[shape]]:
+                super().itemconfig(item, state="hidden")
+        self._marker_pool_used:dict[str,int] = used
+
 
-            bounds:tuple[int] = super().bbox(text)
-            super().move(text, bounds[0]-bounds[2], 0)
+def make_scrolled(master:tk.Misc, text_widget:tk.Text,
+                  **kwargs) -> ScrolledText:
+    return ScrolledText(master, text_widget, **kwargs)
 
-            i:str = self.text_widget.index(f"{i} +1l")
 
+class ScrollGroupMember:
+    __slots__ = "text_widget", "vscroll", "hscroll", "line_numbers", \
+                "to_line", "from_line", "echo_y", "echo_x"
 
-def make_scrolled(master:tk.Misc, text_widget:tk.Text, **kwargs):
-    ScrolledText(master, text_widget, **kwargs)
+    def __init__(self, text_widget:tk.Text, vscroll:BaseBetterScrollBar,
+                 hscroll:BaseBetterScrollBar, line_numbers:LineNumbers,
+                 to_line:Function[int,int], from_line:Function[int,int]):
+        self.text_widget:tk.Text = text_widget
+        self.vscroll:BaseBetterScrollBar = vscroll
+        self.hscroll:BaseBetterScrollBar = hscroll
+        self.line_numbers:LineNumbers = line_numbers
+        self.to_line:Function[int,int] = to_line
+        self.from_line:Function[int,int] = from_line
+        # The positions that the group moved this member to
+        self.echo_y:float|int = None
+        self.echo_x:float = None
+
+    def top_line(self) -> int:
+        return int(self.text_widget.index("@0,0").split(".")[0])
+
+    def get_y(self, by_lines:bool, low:str=None) -> float|int:
+        if by_lines:
+            return self.from_line(self.top_line())
+        if low is None:
+            low:str = self.text_widget.yview()[0]
+        return float(low)
+
+    def same_y(self, a:float|int, b:float|int, by_lines:bool) -> bool:
+        """
+        Line numbers must match exactly but fractions only have to be
+          within 1 line of each other because tk refines them as it works
+          out the heights of the lines.
+        """
+        if (a is None) or (b is None):
+            return False
+        if by_lines:
+            return a == b
+        lines:int = int(self.text_widget.index("end").split(".")[0])
+        return abs(a-b) <= 1/lines
+
+    def scroll_to_line(self, line:int) -> None:
+        """
+        Scrolls so that `line` is at the top
+        """
+        text:tk.Text = self.text_widget
+        y:int = (text.count("1.0", f"{line}.0", "ypixels") or (0,))[0]
+        total:int = (text.count("1.0", "end", "ypixels") or (0,))[0]
+        text.yview("moveto", y/max(1, total))
+
+
+class ScrollGroup:
+    """
+    Scrolls a group of text widgets (with their scrollbars and line
+      numbers) together. Used for diff/side by side views.
+    Each member can have a `to_line`/`from_line` pair of functions that
+      map the group's (reference) line numbers to the member's line
+      numbers and back. If any member has them, the group is synchronised
+      by line numbers, otherwise by the yview fractions.
+    When a member scrolls, the rest of the members are moved once per
+      idle cycle to the latest position. While a member keeps reporting
+      (roughly) the position that the group moved it to, it's an echo and
+      is ignored so the members can't keep scrolling each other. tk can
+      report the same scroll more than once and refines the fractions
+      later, so an echo is only forgotten once the member reports a
+      different position.
+
+    group = ScrollGroup()
+    group.add_scrolled(make_scrolled(left_frame, left_text))
+    group.add_scrolled(make_scrolled(right_frame, right_text))
+    """
+    __slots__ = "members", "by_lines", "_y", "_x", "_y_source", \
+                "_x_source", "_dispatch_id"
+
+    def __init__(self) -> ScrollGroup:
+        self.members:list[ScrollGroupMember] = []
+        self.by_lines:bool = False
+        self._y_source:ScrollGroupMember = None
+        self._x_source:ScrollGroupMember = None
+        self._dispatch_id:str = None
+        self._y:float|int = None
+        self._x:float = None
+
+    def add(self, text_widget:tk.Text, vscroll:BaseBetterScrollBar=None,
+            hscroll:BaseBetterScrollBar=None, line_numbers:LineNumbers=None,
+            to_line:Function[int,int]=None,
+            from_line:Function[int,int]=None) -> ScrollGroupMember:
+        assert (to_line is None) == (from_line is None), \
+               "Pass in both `to_line` and `from_line` or neither"
+        if to_line is not None:
+            self.by_lines:bool = True
+        else:
+            to_line = from_line = lambda line: line
+        member:ScrollGroupMember = ScrollGroupMember(text_widget, vscroll,
+                                                     hscroll, line_numbers,
+                                                     to_line, from_line)
+        yscroll = lambda low, high: self._on_yscroll(member, low, high)
+        xscroll = lambda low, high: self._on_xscroll(member, low, high)
+        text_widget.config(yscrollcommand=yscroll, xscrollcommand=xscroll)
+        self.members.append(member)
+        return member
+
+    def add_scrolled(self, scrolled_text:ScrolledText,
+                     **kwargs:dict) -> ScrollGroupMember:
+        return self.add(scrolled_text.text_widget,
+                        vscroll=getattr(scrolled_text, "vscroll", None),
+                        hscroll=getattr(scrolled_text, "hscroll", None),
+                        line_numbers=getattr(scrolled_text, "line_numbers",
+                                             None),
+                        **kwargs)
+
+    def remove(self, member:ScrollGroupMember) -> None:
+        self.members.remove(member)
+        member.text_widget.config(yscrollcommand="", xscrollcommand="")
+
+    def _on_yscroll(self, member:ScrollGroupMember, low:str, high:str) -> None:
+        if member.vscroll is not None:
+            member.vscroll.set(low, high)
+        if member.line_numbers is not None:
+            member.line_numbers.redraw()
+        position:float|int = member.get_y(self.by_lines, low)
+        if member.same_y(position, member.echo_y, self.by_lines):
+            return None
+        # The user scrolled this member. Forget the echo so that scrolling
+        #   back to the same position later isn't ignored
+        member.echo_y:float|int = None
+        if member.same_y(position, self._y, self.by_lines):
+            return None
+        self._y:float|int = position
+        self._y_source:ScrollGroupMember = member
+        self._schedule_dispatch(member.text_widget)
+
+    def _on_xscroll(self, member:ScrollGroupMember, low:str, high:str) -> None:
+        if member.hscroll is not None:
+            member.hscroll.set(low, high)
+        position:float = float(low)
+        if (member.echo_x is not None) and \
+           (abs(position-member.echo_x) <= X_TOLERANCE):
+            return None
+        member.echo_x:float = None
+        if (self._x is not None) and (abs(position-self._x) <= X_TOLERANCE):
+            return None
+        self._x:float = position
+        self._x_source:ScrollGroupMember = member
+        self._schedule_dispatch(member.text_widget)
+
+    def _schedule_dispatch(self, widget:tk.Misc) -> None:
+        if self._dispatch_id is None:
+            self._dispatch_id:str = widget.after_idle(self._dispatch)
+
+    def _dispatch(self) -> None:
+        self._dispatch_id:str = None
+        y_source, self._y_source = self._y_source, None
+        x_source, self._x_source = self._x_source, None
+        for member in self.members:
+            text:tk.Text = member.text_widget
+            if (y_source is not None) and (member is not y_source):
+                if self.by_lines:
+                    line:int = member.to_line(self._y)
+                    if line != member.top_line():
+                        member.scroll_to_line(line)
+                else:
+                    text.yview("moveto", self._y)
+                member.echo_y:float|int = member.get_y(self.by_lines)
+            if (x_source is not None) and (member is not x_source):
+                text.xview("moveto", self._x)
+                member.echo_x:float = float(text.xview()[0])
 
 
 # Example 1
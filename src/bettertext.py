@@ -3,6 +3,11 @@ from idlelib.percolator import Percolator
 from idlelib.delegator import Delegator
 import tkinter as tk
 
+try:
+    from scrollengine import ScrollEngine
+except ImportError:
+    from .scrollengine import ScrollEngine
+
 
 DEBUG_SEE:bool = False
 DEBUG_BG_TAG:bool = False
@@ -138,6 +143,7 @@ INHERIT_FROM_CANVAS:tuple[str] = (
             "rowconfigure", "size", "slaves"
                                  )
 SCROLL_SPEED:int = 12 # In pixels (probably should be an attribute)
+VSCROLL_SPEED:int = 50 # In pixels (same as tcl's default)
 
 
 class XViewFix(Delegator):
@@ -264,16 +270,20 @@ class BetterText(tk.Text):
         self.percolator:Percolator = Percolator(self)
         self.percolator.insertfilter(self._xviewfix)
 
-        super().bind("<MouseWheel>", self._scroll_windows)
-        super().bind("<Button-4>", self._scroll_linux)
-        super().bind("<Button-5>", self._scroll_linux)
+        # Set `self.scroller.momentum` for smooth scrolling
+        self.scroller:ScrollEngine = ScrollEngine(self, self._scroll_x_pixels,
+                                                  self._scroll_y_pixels,
+                                pixels_per_notch=(SCROLL_SPEED, VSCROLL_SPEED))
+        super().bind("<MouseWheel>", self._on_mousewheel)
+        super().bind("<Button-4>", self._on_mousewheel)
+        super().bind("<Button-5>", self._on_mousewheel)
         super().bind("<B1-Motion>", self._redraw_sel_bg)
         super().bind("<ButtonPress-1>", self._redraw_sel_bg)
         super().bind("<ButtonRelease-1>", self._redraw_sel_bg)
 
-        self._canvas.bind("<MouseWheel>", self._scroll_windows)
-        self._canvas.bind("<Button-4>", self._scroll_linux)
-        self._canvas.bind("<Button-5>", self._scroll_linux)
+        self._canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self._canvas.bind("<Button-4>", self._on_mousewheel)
+        self._canvas.bind("<Button-5>", self._on_mousewheel)
         self._canvas.bind("<B1-Motion>", self._redirect_event)
         self._canvas.bind("<ButtonPress-1>", self._redirect_event)
         self._canvas.bind("<ButtonRelease-1>", self._redirect_event)
@@ -449,49 +459,24 @@ class BetterText(tk.Text):
             return None
         raise NotImplementedError(f"Implement {args!r}")
 
-    def _scroll_linux(self, event:tk.Event) -> str:
+    def _on_mousewheel(self, event:tk.Event) -> str:
         """
-        If we get a scrolling event event:
-         -------- --------------------- -----------------------
-        |        |     Horizontal      |       Vertical        |
-         -------- --------------------- -----------------------
-        | Canvas | self._scroll(steps) | Send to Text widget   |
-        | Text   | self._scroll(steps) | Allow to pass through |
-         -------- --------------------- -----------------------
+        Both the canvas and the text widget send their scrolling events
+          to `self.scroller` which calls `_scroll_x_pixels` (with shift)
+          or `_scroll_y_pixels` at most once per frame.
         """
         if event.widget not in (self, self._canvas):
             return None
-        if not (event.state&1):
-            if event.widget == self._canvas:
-                super().event_generate(f"<Button-{event.num}>")
-            else:
-                super().after(1, self._redraw_tags_with_bg)
-            return None
-        steps:int = SCROLL_SPEED * (1-(event.num == 4)*2)
-        self._lock_tags_with_bg:bool = True
-        self._scroll(steps)
-        self._lock_tags_with_bg:bool = False
-        return "break"
+        return self.scroller.on_wheel(event)
 
-    def _scroll_windows(self, event:tk.Event) -> str:
-        """
-        Same as `_scroll_linux` but for windows which uses `<MouseWheel>`
-        events with `event.delta`
-        """
-        if event.widget not in (self, self._canvas):
-            return None
-        if not (event.state&1):
-            if event.widget == self._canvas:
-                super().event_generate("<MouseWheel>", delta=event.delta)
-            else:
-                super().after(1, self._redraw_tags_with_bg)
-            return None
-        assert event.delta != 0, "On Windows, `event.delta` should never be 0"
-        steps:int = int(-event.delta/abs(event.delta)*SCROLL_SPEED+0.5)
+    def _scroll_x_pixels(self, pixels:int) -> None:
         self._lock_tags_with_bg:bool = True
-        self._scroll(steps)
+        self._scroll(pixels)
         self._lock_tags_with_bg:bool = False
-        return "break"
+
+    def _scroll_y_pixels(self, pixels:int) -> None:
+        super().yview_scroll(pixels, "pixels")
+        self._redraw_tags_with_bg()
 
     def _scroll(self, steps:int) -> None:
         """
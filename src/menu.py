@@ -4,8 +4,12 @@ import tkinter as tk
 
 try:
     from . import BetterTk, IS_UNIX, IS_WINDOWS
+    from .betterscrollbar import BetterScrollBarVertical
+    from .betterframe import VirtualListFrame, RootSingleton
 except ImportError:
     from __init__ import BetterTk, IS_UNIX, IS_WINDOWS
+    from betterscrollbar import BetterScrollBarVertical
+    from betterframe import VirtualListFrame, RootSingleton
 
 
 FRAME_KWARGS:dict[str,str] = dict(highlightthickness=0, bd=0, bg="black")
@@ -14,16 +18,50 @@ BUTTON_KWARGS:dict[str:str] = dict(relief="flat", bg="black", fg="white",
                                    activeforeground="white", anchor="nw",
                                    highlightthickness=0, bd=0)
 MENU_BD:int = 2
+SHIFT_MASK:int = 1
+CONTROL_MASK:int = 4
+ALT_MASK:int = 0x20000 if IS_WINDOWS else 8
+MODIFIERS:dict[str,int] = {"ctrl":CONTROL_MASK, "control":CONTROL_MASK,
+                           "shift":SHIFT_MASK, "alt":ALT_MASK}
+MODIFIERS_MASK:int = SHIFT_MASK | CONTROL_MASK | ALT_MASK
+# Maps the symbols shown in accelerators to their `event.keysym`s
+SYMBOL_KEYSYMS:dict[str,str] = {"+":"plus", "-":"minus", "=":"equal",
+                                "/":"slash", "\\":"backslash", ",":"comma",
+                                ".":"period", ";":"semicolon", "'":"apostrophe",
+                                "`":"grave", "[":"bracketleft",
+                                "]":"bracketright", "*":"asterisk"}
 
 
 def remove_titlebar(root:tk.Tk|tk.Toplevel) -> None:
     if IS_UNIX:
         root.attributes("-type", "splash")
     elif IS_WINDOWS:
-        root.overrideredirect()
+        root.overrideredirect(True)
     else:
         raise NotImplementedError("UnrecognisedOS")
 
+def parse_accelerator(accelerator:str) -> tuple[int,str]:
+    """
+    Turns an accelerator like "Ctrl+Shift+S" into `(state, keysym)` where
+      `state` is the modifiers' `event.state` mask and `keysym` is
+      lowercase. That is the key used in `BetterMenu.accelerators`.
+      Symbols are turned into their keysyms (for example "Ctrl++" gives
+      `(CONTROL_MASK, "plus")` and "Ctrl+/" gives `(CONTROL_MASK, "slash")`).
+    """
+    accelerator:str = accelerator.strip()
+    if accelerator.endswith("+"):
+        # The key itself is "+"
+        modifiers, keysym = accelerator[:-1].rstrip().rstrip("+"), "+"
+    else:
+        modifiers, _, keysym = accelerator.rpartition("+")
+    state:int = 0
+    for modifier in filter(None, map(str.strip, modifiers.split("+"))):
+        modifier:str = modifier.lower()
+        assert modifier in MODIFIERS, f"Unknown modifier: {modifier!r}"
+        state |= MODIFIERS[modifier]
+    keysym:str = keysym.strip()
+    return state, SYMBOL_KEYSYMS.get(keysym, keysym).lower()
+
 def stack_diff(old:list[T], new:list[T]) -> tuple[list[T],list[T]]:
     remove:list[T] = []
     add:list[T] = []
@@ -39,23 +77,77 @@ def stack_diff(old:list[T], new:list[T]) -> tuple[list[T],list[T]]:
     return remove, add
 
 
+class OutsideClickDetector(RootSingleton):
+    """
+    One per tcl interpreter (use `OutsideClickDetector.get(widget)`).
+      While at least one menu is open, there is a single
+      `bind_all("<Button-1>")` that closes the open menus that don't
+      contain the clicked widget (checked using each menu's precomputed
+      `widget_paths`). The binding is removed when the last menu closes
+      so clicks cost nothing when no menu is open.
+    """
+    __slots__ = "root", "open_menus", "funcid"
+    ROOT_ATTR:str = "_outside_click"
+
+    def __init__(self, root:tk.Misc) -> OutsideClickDetector:
+        self.open_menus:dict[BetterMenu,None] = {}
+        self.root:tk.Misc = root
+        self.funcid:str = None
+
+    def menu_opened(self, menu:BetterMenu) -> None:
+        self.open_menus[menu] = None
+        if self.funcid is None:
+            self.funcid:str = self.root.bind_all("<Button-1>", self.on_click,
+                                                 add=True)
+
+    def menu_closed(self, menu:BetterMenu) -> None:
+        self.open_menus.pop(menu, None)
+        if (len(self.open_menus) == 0) and (self.funcid is not None):
+            self._unbind()
+
+    def _unbind(self) -> None:
+        # `unbind_all` would also remove everyone else's bindings
+        script:str = self.root.tk.call("bind", "all", "<Button-1>")
+        lines:list[str] = [line for line in script.split("\n")
+                           if self.funcid not in line]
+        self.root.tk.call("bind", "all", "<Button-1>", "\n".join(lines))
+        self.root.deletecommand(self.funcid)
+        self.funcid:str = None
+
+    def on_click(self, event:tk.Event) -> None:
+        if isinstance(event.widget, str):
+            return None # Don't know why this happens
+        path:str = str(event.widget)
+        for menu in tuple(self.open_menus):
+            if path not in menu.widget_paths:
+                menu.change_shown_to(None)
+
+
 class MenuItem:
-    __slots__ = "widget", "parentmenu"
+    __slots__ = "widget", "parentmenu", "accelerator"
 
-    def __init__(self, widget:tk.Misc, parentmenu:BetterMenuBase):
+    def __init__(self, widget:tk.Misc, parentmenu:BetterMenuBase,
+                 accelerator:str=None):
         self.parentmenu:BetterMenuBase = parentmenu
+        self.accelerator:str = accelerator
         self.widget:tk.Misc = widget
         self.widget.menuitem:MenuItem = self
 
 
 class BetterMenuBase:
-    __slots__ = "parent", "shown", "direction", "container", "rootmenu"
+    """
+    `mnemonics` maps the (lowercase) underlined letter of each item in
+      this menu to the item (look at `BetterMenu`).
+    """
+    __slots__ = "parent", "shown", "direction", "container", "rootmenu", \
+                "mnemonics"
 
     def __init__(self, parent:MenuItem, direction:str) -> BetterMenuBase:
         assert isinstance(direction, str), "TypeError"
         assert isinstance(parent, MenuItem), "TypeError"
         assert direction in ("horizontal", "vertical"), "ValueError"
         self.rootmenu:BetterMenu = parent.parentmenu.rootmenu
+        self.mnemonics:dict[str,MenuItem] = {}
         self.direction:bool = direction
         self.parent:MenuItem = parent
         self.shown:bool = False
@@ -83,19 +175,34 @@ class BetterMenuBase:
         self.shown:bool = False
         self.hide()
 
-    def add_command(self, name:str, func:Function=None) -> MenuItem:
+    def add_command(self, name:str, func:Function=None,
+                    accelerator:str=None, underline:int=-1) -> MenuItem:
+        """
+        `accelerator` is a shortcut like "Ctrl+S" that runs the command
+          (it's also shown next to the name). `underline` is the index of
+          the letter in `name` that selects this item from the keyboard
+          (look at `BetterMenu`).
+        """
         def wrapper() -> None:
             self.rootmenu.change_shown_to(None)
             if func is not None:
                 func()
-        button:tk.Button = tk.Button(self.container, text=name, command=wrapper,
-                                     **BUTTON_KWARGS)
+        text:str = name if accelerator is None else f"{name}    {accelerator}"
+        button:tk.Button = tk.Button(self.container, text=text, command=wrapper,
+                                     underline=underline, **BUTTON_KWARGS)
+        self.rootmenu.widget_paths.add(str(button))
         if self.direction == "horizontal":
             button.pack(side="left", anchor="nw", fill="both")
         else:
             button.pack(side="top", anchor="nw", fill="both")
         button.bind("<Enter>", self.mouse_over)
-        return MenuItem(button, self)
+        menuitem:MenuItem = MenuItem(button, self, accelerator)
+        if 0 <= underline < len(name):
+            self.mnemonics.setdefault(name[underline].lower(), menuitem)
+        if accelerator is not None:
+            key:tuple[int,str] = parse_accelerator(accelerator)
+            self.rootmenu.accelerators.setdefault(key, []).append(menuitem)
+        return menuitem
 
     def add_separator(self, thickness:int=2, colour:str="grey",
                                              padding:int=5) -> MenuItem:
@@ -110,17 +217,36 @@ class BetterMenuBase:
         canvas:tk.Canvas = tk.Canvas(self.container, bd=0, highlightthickness=0,
                                      width=width, height=height, bg=colour)
         canvas.pack(anchor="nw", fill="both", padx=padding, **pack_kwargs)
+        self.rootmenu.widget_paths.add(str(canvas))
         canvas.bind("<Enter>", self.mouse_over)
         return MenuItem(canvas, self)
 
-    def add_submenu(self, name:str, direction:str) -> BetterSubMenu:
+    def add_submenu(self, name:str, direction:str,
+                    underline:int=-1) -> BetterSubMenu:
+        create = lambda menuitem: BetterSubMenu(menuitem, direction)
+        return self._add_submenu(name, create, underline)
+
+    def add_dynamic_submenu(self, name:str,
+                            provider:Function[Iterable[tuple[str,Function]]],
+                            max_rows:int=20, width:int=200,
+                            underline:int=-1) -> BetterDynamicSubMenu:
+        """
+        Look at `BetterDynamicSubMenu`
+        """
+        create = lambda menuitem: BetterDynamicSubMenu(menuitem, provider,
+                                                       max_rows=max_rows,
+                                                       width=width)
+        return self._add_submenu(name, create, underline)
+
+    def _add_submenu(self, name:str, create:Function[MenuItem,BetterSubMenu],
+                     underline:int) -> BetterSubMenu:
         def wrapper(event:tk.Event=None) -> None:
             if (event is not None) and (len(self.rootmenu.stack) == 0):
                 return None
             self.rootmenu.change_shown_to(submenu)
-        menuitem:MenuItem = self.add_command(name, wrapper)
+        menuitem:MenuItem = self.add_command(name, wrapper, underline=underline)
         menuitem.widget.bind("<Enter>", wrapper)
-        submenu:BetterSubMenu = BetterSubMenu(menuitem, direction)
+        submenu:BetterSubMenu = create(menuitem)
         return submenu
 
     def create_container(self) -> tk.Misc:
@@ -134,9 +260,15 @@ class BetterMenuBase:
 
 
 class BetterSubMenu(BetterMenuBase):
-    __slots__ = "root"
+    """
+    The toplevel (and its window manager attributes) is set up once when
+      the submenu is created. After that, showing/hiding the submenu is a
+      single map/unmap (plus moving it if its parent moved).
+    """
+    __slots__ = "root", "position"
 
     def __init__(self, parent:MenuItem, direction:str) -> BetterSubMenu:
+        self.position:tuple[int,int] = None
         super().__init__(parent, direction)
 
     def create_container(self) -> tk.Misc:
@@ -144,22 +276,26 @@ class BetterSubMenu(BetterMenuBase):
         self.root:tk.Misc = tk.Toplevel(button)
         self.root.config(bg="grey")
         self.root.withdraw()
+        # The window type must be set before the window is first mapped
+        remove_titlebar(self.root)
+        self.root.attributes("-topmost", True)
         frame:tk.Frame = tk.Frame(self.root, bg="black", bd=0,
                                   highlightthickness=0)
         frame.pack(fill="both", expand=True, padx=MENU_BD, pady=MENU_BD)
+        self.rootmenu.widget_paths.update((str(self.root), str(frame)))
         return frame
 
     def show(self) -> None:
-        x = self.parent.widget.winfo_rootx()
-        y = self.parent.widget.winfo_rooty()
+        x:int = self.parent.widget.winfo_rootx()
+        y:int = self.parent.widget.winfo_rooty()
         if self.parent.parentmenu.direction == "horizontal":
             y += self.parent.widget.winfo_height()
         else:
             x += self.parent.widget.winfo_width()
-        self.root.geometry(f"+{x}+{y}")
-        self.root.iconify()
-        remove_titlebar(self.root)
-        self.root.attributes("-topmost", True)
+        if self.position != (x, y):
+            self.position:tuple[int,int] = (x, y)
+            self.root.geometry(f"+{x}+{y}")
+        self.root.deiconify()
 
     def hide(self) -> None:
         self.root.withdraw()
@@ -173,44 +309,205 @@ class BetterSubMenu(BetterMenuBase):
             self:BetterSubMenu = self.parent.parentmenu
 
 
+class BetterDynamicSubMenu(BetterSubMenu):
+    """
+    A submenu whose items (`(name, func)` tuples) come from `provider()`
+      which is only called when the submenu is opened. The result is
+      cached until `invalidate()` is called.
+    The items are shown in a `VirtualListFrame` so only the visible rows
+      have buttons (which are reused as the list is scrolled) and at most
+      `max_rows` rows are visible at once. That means that the cost of
+      the submenu doesn't depend on the number of items.
+    """
+    __slots__ = "provider", "items", "max_rows", "width", "list", \
+                "row_height"
+
+    def __init__(self, parent:MenuItem,
+                 provider:Function[Iterable[tuple[str,Function]]],
+                 max_rows:int=20, width:int=200) -> BetterDynamicSubMenu:
+        assert max_rows > 0, "ValueError"
+        self.provider:Function[Iterable[tuple[str,Function]]] = provider
+        self.items:list[tuple[str,Function]] = None
+        self.max_rows:int = max_rows
+        self.width:int = width
+        super().__init__(parent, "vertical")
+
+    def create_container(self) -> tk.Misc:
+        frame:tk.Frame = super().create_container()
+        probe:tk.Button = tk.Button(frame, text="Probe", **BUTTON_KWARGS)
+        self.row_height:int = probe.winfo_reqheight()
+        probe.destroy()
+        self.list:VirtualListFrame = VirtualListFrame(frame, 0,
+                                     self._create_row, self._bind_row,
+                                     estimated_height=self.row_height,
+                                     width=self.width, height=self.row_height,
+                                     bg="black",
+                                     VScrollBarClass=BetterScrollBarVertical,
+                                     scrollbar_kwargs={"thickness":4})
+        self.list.pack(fill="both", expand=True)
+        self.list.v_scrollbar.hide:bool = True
+        self.rootmenu.widget_paths.update(map(str, (self.list.master_frame,
+                                                    self.list.dummy_canvas,
+                                                    self.list,
+                                                    self.list.v_scrollbar)))
+        return frame
+
+    def _create_row(self, frame:VirtualListFrame) -> tk.Button:
+        # The command is set once (instead of in `_bind_row`) so that
+        #   reusing the button doesn't register a new tcl command
+        button:tk.Button = tk.Button(frame, **BUTTON_KWARGS,
+                                     command=lambda: self._invoke(button))
+        button.bind("<Enter>", self.mouse_over)
+        self.rootmenu.widget_paths.add(str(button))
+        return button
+
+    def _bind_row(self, button:tk.Button, idx:int) -> None:
+        button.idx:int = idx
+        button.config(text=self.items[idx][0])
+
+    def _invoke(self, button:tk.Button) -> None:
+        _, func = self.items[button.idx]
+        self.rootmenu.change_shown_to(None)
+        if func is not None:
+            func()
+
+    def show(self) -> None:
+        if self.items is None:
+            self.refresh()
+        super().show()
+
+    def invalidate(self) -> None:
+        """
+        Forgets the cached items. `provider` will be called again the next
+          time the submenu is opened (or now if it's already open).
+        """
+        self.items:list[tuple[str,Function]] = None
+        if self.shown:
+            self.refresh()
+
+    def refresh(self) -> None:
+        self.items:list[tuple[str,Function]] = list(self.provider())
+        rows:int = max(1, min(len(self.items), self.max_rows))
+        self.list.resize(height=rows*self.row_height)
+        self.list.set_row_count(len(self.items))
+        self.list.see(0)
+
+
 class BetterMenu(BetterMenuBase):
-    __slots__ = "stack", "rootmenu"
+    """
+    `widget_paths` has the paths of all of the widgets that are part of
+      this menu (including its submenus). Clicking anywhere else closes
+      the menu (look at `OutsideClickDetector`).
+    Keyboard shortcuts for the whole menu tree go through a single
+      <KeyPress> binding on `self.bindtag` which is put in front of the
+      bindtags of each widget (in `master`'s toplevel) when it gets the
+      focus, so it runs before (and can stop) the widget's class
+      bindings (for example <Control-o> in a `tk.Text`):
+        * `accelerators` maps `parse_accelerator(accelerator)` to the
+          items with that accelerator (the first one wins, use
+          `get_conflicts` to find the rest). It's filled in by
+          `add_command` so dispatching a shortcut is 1 dict lookup.
+        * Alt+<letter> opens the item in the menu bar with that letter
+          underlined and while a submenu is open, <letter> selects the
+          item in the deepest submenu (look at `BetterMenuBase.mnemonics`)
+          and <Escape> closes the menu. Other keys without modifiers are
+          ignored while a submenu is open.
+    """
+    __slots__ = "stack", "rootmenu", "widget_paths", "accelerators", \
+                "bindtag"
 
     def __init__(self, master:tk.Misc, direction:str) -> BetterMenu:
+        self.accelerators:dict[tuple[int,str],list[MenuItem]] = {}
+        self.widget_paths:set[str] = set()
         self.rootmenu:BetterMenu = self
         super().__init__(MenuItem(master, self), direction)
         self.stack:tuple[BetterMenuBase] = ()
         self.shown:bool = True
+        self.bindtag:str = f"BetterMenu{id(self)}"
+        master.bind_class(self.bindtag, "<KeyPress>", self.on_key)
+        toplevel:tk.Misc = master.winfo_toplevel()
+        toplevel.bind("<FocusIn>", self._add_bindtag, add=True)
+        try:
+            focused:tk.Misc = toplevel.focus_get()
+        except KeyError:
+            focused:tk.Misc = None
+        if (focused is not None) and (focused.winfo_toplevel() == toplevel):
+            self._add_bindtag(widget=focused)
+
+    def _add_bindtag(self, event:tk.Event=None, widget:tk.Misc=None) -> None:
+        if event is not None:
+            widget:tk.Misc = event.widget
+        if isinstance(widget, str):
+            return None # Don't know why this happens
+        bindtags:tuple[str] = widget.bindtags()
+        if self.bindtag not in bindtags:
+            widget.bindtags((self.bindtag,) + bindtags)
+
+    def on_key(self, event:tk.Event) -> str:
+        state:int = event.state & MODIFIERS_MASK
+        keysym:str = event.keysym.lower()
+        if len(self.stack) > 0:
+            if keysym == "escape":
+                self.change_shown_to(None)
+                return "break"
+            if state == 0:
+                menuitem:MenuItem = self.stack[-1].mnemonics.get(keysym, None)
+                if menuitem is not None:
+                    menuitem.widget.invoke()
+                # The keyboard belongs to the open menu
+                return "break"
+        elif state == ALT_MASK:
+            menuitem:MenuItem = self.mnemonics.get(keysym, None)
+            if menuitem is not None:
+                menuitem.widget.invoke()
+                return "break"
+        menuitems:list[MenuItem] = self.accelerators.get((state, keysym), None)
+        if (menuitems is None) and (state & SHIFT_MASK):
+            # Some symbols (like "+") need shift but "Ctrl++" doesn't say so
+            key:tuple[int,str] = (state & ~SHIFT_MASK, keysym)
+            menuitems:list[MenuItem] = self.accelerators.get(key, None)
+        if menuitems is None:
+            return ""
+        menuitems[0].widget.invoke()
+        return "break"
+
+    def get_conflicts(self) -> dict[tuple[int,str],list[MenuItem]]:
+        """
+        Returns the accelerators that are used by more than 1 item
+        """
+        return {key:menuitems for key, menuitems in self.accelerators.items()
+                if len(menuitems) > 1}
 
     def change_shown_to(self, submenu:BetterSubMenu) -> None:
+        """
+        Only hides/shows the submenus that aren't in both the old and the
+          new stack (look at `stack_diff`)
+        """
         if submenu is None:
             new:tuple[BetterMenuBase] = ()
         else:
             new:tuple[BetterMenuBase] = tuple(submenu.get_stack())
+        if new == self.stack:
+            return None
         removes, adds = stack_diff(self.stack, new)
-        for submenu in removes:
+        # Hide the deepest submenus first
+        for submenu in reversed(removes):
             submenu._hide()
         for submenu in adds:
             submenu._show()
+        detector:OutsideClickDetector = OutsideClickDetector.get(self.container)
+        if len(self.stack) == 0:
+            detector.menu_opened(self)
+        elif len(new) == 0:
+            detector.menu_closed(self)
         self.stack = new
 
     def get_stack(self) -> Iterable[BetterMenuBase]:
         return ()
 
     def create_container(self) -> tk.Misc:
-        def hide_all(event:tk.Event) -> None:
-            if len(self.stack) == 0:
-                return None
-            widget:tk.Misc = event.widget
-            if isinstance(widget, str):
-                return None # Don't know why this happens
-            while widget is not None:
-                if widget == frame:
-                    return None
-                widget:tk.Misc = widget.master
-            self.change_shown_to(None)
         frame:tk.Frame = tk.Frame(self.parent.widget, **FRAME_KWARGS)
-        frame.bind_all("<Button-1>", hide_all, add=True)
+        self.widget_paths.add(str(frame))
         return frame
 
     def pack(self, **kwargs) -> None:
@@ -233,20 +530,41 @@ class BetterMenu(BetterMenuBase):
 
 
 if __name__ == "__main__":
+    assert parse_accelerator("Ctrl+Shift+S") == (CONTROL_MASK|SHIFT_MASK, "s")
+    assert parse_accelerator("Ctrl++") == (CONTROL_MASK, "plus")
+    assert parse_accelerator("Ctrl + -") == (CONTROL_MASK, "minus")
+    assert parse_accelerator("Ctrl+/") == (CONTROL_MASK, "slash")
+    assert parse_accelerator("F5") == (0, "f5")
+
     root = tk.Tk()
     root.config(bg="black")
     menu = BetterMenu(root, direction="horizontal")
-    filemenu = menu.add_submenu("File", direction="vertical")
-    filemenu.add_command("Open", lambda: print("open"))
+    filemenu = menu.add_submenu("File", direction="vertical", underline=0)
+    filemenu.add_command("Open", lambda: print("open"), underline=0,
+                         accelerator="Ctrl+O")
 
-    savemenu = filemenu.add_submenu("Save Options", direction="vertical")
-    savemenu.add_command("Save", lambda: print("save"))
-    savemenu.add_command("Save As", lambda: print("saveas"))
+    savemenu = filemenu.add_submenu("Save Options", direction="vertical",
+                                    underline=0)
+    savemenu.add_command("Save", lambda: print("save"), underline=0,
+                         accelerator="Ctrl+S")
+    savemenu.add_command("Save As", lambda: print("saveas"), underline=5,
+                         accelerator="Ctrl+Shift+S")
+
+    recent = lambda: [(f"File number {i}.txt", lambda i=i: print(i))
+                      for i in range(500)]
+    filemenu.add_dynamic_submenu("Recent Files", recent)
 
     filemenu.add_separator()
     filemenu.add_command("Close", lambda: print("close"))
 
     menu.add_command("Edit", lambda: print("edit"))
+    viewmenu = menu.add_submenu("View", direction="vertical", underline=0)
+    viewmenu.add_command("Zoom in", lambda: print("zoom in"), underline=5,
+                         accelerator="Ctrl++")
+    viewmenu.add_command("Zoom out", lambda: print("zoom out"), underline=5,
+                         accelerator="Ctrl+-")
+    viewmenu.add_command("Toggle comment", lambda: print("comment"),
+                         underline=0, accelerator="Ctrl+/")
     menu.add_command("Format", lambda: print("format"))
     menu.pack(anchor="w")
 
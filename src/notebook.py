@@ -1,12 +1,16 @@
 from __future__ import annotations
+from collections import OrderedDict
+from bisect import bisect_left
+from time import perf_counter
+from math import sqrt
 import tkinter as tk
 
 try:
-    from betterframe import BetterFrame, make_bind_frame
+    from betterframe import BetterFrame, FenwickTree, make_bind_frame
     from betterscrollbar import BetterScrollBarHorizontal
     from bettertk import IS_UNIX
 except ImportError:
-    from .betterframe import BetterFrame, make_bind_frame
+    from .betterframe import BetterFrame, FenwickTree, make_bind_frame
     from .betterscrollbar import BetterScrollBarHorizontal
     from .bettertk import IS_UNIX
 
@@ -27,201 +31,478 @@ tk.Canvas.create_round_rectangle = round_rectangle
 
 WIDGET_KWARGS:dict = dict(highlightthickness=0, bd=0, takefocus=False)
 NOTCH_BG:str = "#444444"
+# The (background, text) colours of the notches in each state
+NOTCH_COLOURS:dict[str,tuple[str,str]] = {"normal": (NOTCH_BG, "white"),
+                                          "focused": ("black", "white")}
+NOTCH_RADIUS:int = 25
+NOTCH_IMAGE_CACHE_SIZE:int = 64
 NOT_DRAG_DIST:int = 10
+DRAG_FRAME_MS:int = 16 # Dragging is redrawn at most once per frame
 BUTTON1_TK_STATE:int = 256
 
 
-class TabNotch(tk.Canvas):
-    __slots__ = "text_id", "text", "page", "rrect_id", "width", "min_size"
-    PADX:int = 7
+class NotchImageCache:
+    """
+    A bounded (least recently used) cache of pre-rendered notch
+      backgrounds shared by all notebooks. The images are keyed by
+      (width, height, state, colours) so switching tabs doesn't have to
+      draw anything. `TabNotch`s keep a reference to the image they are
+      showing so evicting an image that is still in use is fine.
+    """
+    __slots__ = "images", "max_size"
+
+    def __init__(self, max_size:int) -> NotchImageCache:
+        self.images:OrderedDict[tuple,tk.PhotoImage] = OrderedDict()
+        self.max_size:int = max_size
+
+    def get(self, master:tk.Misc, width:int, height:int, state:str,
+            bg:str) -> tk.PhotoImage:
+        fill, _ = NOTCH_COLOURS[state]
+        # Images belong to a tcl interpreter
+        key:tuple = (master.tk, width, height, state, fill, bg)
+        image:tk.PhotoImage = self.images.get(key, None)
+        if image is None:
+            image:tk.PhotoImage = self.render(master, width, height, fill, bg)
+            self.images[key] = image
+            while len(self.images) > self.max_size:
+                self.images.popitem(last=False)
+        else:
+            self.images.move_to_end(key)
+        return image
 
-    def __init__(self, master:TabNotches, min_size:int=0,
-                 font:str="TkTextFont") -> TabNotch:
-        super().__init__(master, **WIDGET_KWARGS, height=1, width=1,
-                         bg=NOTCH_BG)
-        self.text_id:int = super().create_text((0,0), text="", anchor="nw",
-                                               fill="white", font=font)
+    @staticmethod
+    def render(master:tk.Misc, width:int, height:int, fill:str,
+               bg:str) -> tk.PhotoImage:
+        """
+        Draws the top of a rounded rectangle (the same curve as
+          `round_rectangle`'s smoothed polygon) filled with `fill` on top
+          of `bg`.
+        """
+        image:tk.PhotoImage = tk.PhotoImage(master=master, width=width,
+                                            height=height)
+        image.put(fill, to=(0, 0, width, height))
+        if fill == bg:
+            return image
+        radius:int = min(NOTCH_RADIUS, width//2, height)
+        for y in range(radius):
+            # The corners are quadratic bezier curves from (radius, 0) to
+            #   (0, radius) with (0, 0) as the control point
+            inset:int = round(radius*(1-sqrt((y+0.5)/radius))**2)
+            if inset > 0:
+                image.put(bg, to=(0, y, inset, y+1))
+                image.put(bg, to=(width-inset, y, width, y+1))
+        return image
+
+NOTCH_IMAGES:NotchImageCache = NotchImageCache(NOTCH_IMAGE_CACHE_SIZE)
+
+
+class Notch:
+    """
+    The data behind a tab notch (this is what `NotebookPage.notch` is).
+      `TabNotches` only gives the notches that are visible a `TabNotch`
+      (a canvas) to draw them.
+    """
+    __slots__ = "notches", "page", "text", "text_width", "width", \
+                "min_size", "focused", "key", "view"
+
+    def __init__(self, notches:TabNotches, min_size:int=0) -> Notch:
+        self.notches:TabNotches = notches
         self.min_size:int = min_size
-        self.rrect_id:int = None
-        self.width:int = 0
+        self.page:NotebookPage = None
+        self.view:TabNotch = None
+        self.focused:bool = False
+        self.text_width:int = 0
         self.text:str = None
-        super().bind("<Button-1>", lambda e: master.clicked(self), add=True)
-        super().bind("<Button-2>", lambda e: master.close(self), add=True)
+        self.key:int = None
+        self.width:int = 0
 
     def rename(self, text:str) -> None:
         if self.text == text:
             return None
         self.text:str = text
-        super().itemconfig(self.text_id, text=text)
-        x1, y1, x2, y2 = super().bbox(self.text_id)
-        text_width:int = x2-x1
-        width:int = max(self.min_size, text_width)
-        height:int = y2-y1
-        text_x:int = self.PADX + (width-text_width)//2
-        super().moveto(self.text_id, text_x, height/2)
-        super().config(width=width+2*self.PADX, height=2*height)
-        self.width:int = width+2*self.PADX
-        if self.rrect_id is not None:
-            self.tell_focused()
+        self.text_width:int = self.notches.measure(text)
+        width:int = max(self.min_size, self.text_width) + 2*TabNotch.PADX
+        if width != self.width:
+            self.width:int = width
+            if self.key is not None:
+                self.notches.notch_resized(self)
+        if self.view is not None:
+            self.view.show(self)
 
     def tell_focused(self) -> None:
-        if self.rrect_id is not None:
-            super().delete(self.rrect_id)
-        x1, y1, x2, y2 = super().bbox(self.text_id)
-        width:int = max(self.min_size, x2-x1)
-        height:int = y2-y1
-        points:tuple[int] = (0, 0, width+2*self.PADX, 3*height)
-        self.rrect_id:int = super().create_round_rectangle(*points,
-                                                           radius=25,
-                                                           fill="black")
-        super().tag_lower(self.rrect_id)
+        self.focused:bool = True
+        if self.view is not None:
+            self.view.show(self)
 
     def tell_unfocused(self) -> None:
-        if self.rrect_id is not None:
-            super().delete(self.rrect_id)
+        self.focused:bool = False
+        if self.view is not None:
+            self.view.show(self)
+
+
+class TabNotch(tk.Canvas):
+    """
+    Draws a `Notch`. These are reused by `TabNotches` for different
+      notches as the tabs are scrolled. The background is an image from
+      `NOTCH_IMAGES` so focusing/unfocusing a notch only changes the image
+      and the text colour.
+    """
+    __slots__ = "text_id", "image_id", "image", "notch", "shown"
+    PADX:int = 7
+
+    def __init__(self, master:TabNotches, font:str="TkTextFont") -> TabNotch:
+        super().__init__(master, **WIDGET_KWARGS, height=1, width=1,
+                         bg=NOTCH_BG)
+        self.image_id:int = super().create_image((0,0), anchor="nw")
+        self.text_id:int = super().create_text((0,0), text="", anchor="nw",
+                                               fill="white", font=font)
+        self.shown:tuple[str,int,str] = (None, None, None)
+        self.image:tk.PhotoImage = None
+        self.notch:Notch = None
+        super().bind("<Button-1>", lambda e: master.clicked(self), add=True)
+        super().bind("<Button-2>", lambda e: master.close(self), add=True)
+
+    def show(self, notch:Notch) -> None:
+        """
+        Makes this canvas draw `notch`. Only changes what is different
+          from what it's already showing.
+        """
+        self.notch:Notch = notch
+        state:str = "focused" if notch.focused else "normal"
+        shown:tuple[str,int,str] = (notch.text, notch.width, state)
+        if shown == self.shown:
+            return None
+        old_text, old_width, old_state = self.shown
+        self.shown:tuple[str,int,str] = shown
+        height:int = self.master.line_height
+        if (old_text, old_width) != (notch.text, notch.width):
+            text_x:int = (notch.width-notch.text_width)//2
+            super().itemconfig(self.text_id, text=notch.text)
+            super().moveto(self.text_id, text_x, height/2)
+        if old_width != notch.width:
+            super().config(width=notch.width, height=2*height)
+        self.image:tk.PhotoImage = NOTCH_IMAGES.get(self, notch.width,
+                                                    2*height, state, NOTCH_BG)
+        super().itemconfig(self.image_id, image=self.image)
+        if old_state != state:
+            super().itemconfig(self.text_id, fill=NOTCH_COLOURS[state][1])
 
 
 class TabNotches(BetterFrame):
-    __slots__ = "add_notch", "min_size", "notebook", "notches", "tmp_notch", \
-                "notch_dragging", "dragging", "dragx", "on_reshuffle", "font"
+    """
+    The notches (plain `Notch` objects) are kept in `self.notches` (in the
+      order they are shown) with their widths in `self.widths` (a
+      `FenwickTree`) and sort keys in `self.keys` (always increasing but
+      can have gaps). That means that finding the index/x offset of a
+      notch is O(log n). Removing a notch (unless it's the last one)
+      rebuilds `self.widths` in O(n) but doesn't touch any of the other
+      notches' tk widgets.
+    Only the notches that are visible (plus `overscan` on each side) get
+      a `TabNotch` canvas. The canvases are reused as the tabs are
+      scrolled (like in `VirtualListFrame`) so having lots of tabs open
+      doesn't mean lots of tk widgets. The x axis is scrolled by
+      `self.viewport` (a `ViewportScroller`) so the tabs can be wider
+      than 32767 pixels. When the tabs don't fit, a dropdown button on
+      the right lists all of them.
+    """
+    __slots__ = "add_notch", "min_size", "notebook", "notches", "font", \
+                "notch_dragging", "dragging", "dragx", "on_reshuffle", \
+                "keys", "widths", "next_key", "drag_x_root", "drag_idx", \
+                "drag_start_x_root", "drag_rootx", "_drag_id", \
+                "_drag_bindings", "line_height", "overscan", "_views", \
+                "_free", "_refresh_id", "dropdown", "all_tabs_menu", \
+                "viewport"
 
     def __init__(self, notebook:Notebook, min_size:int=0,
-                 font:str="TkTextFont") -> TabNotches:
+                 font:str="TkTextFont", overscan:int=2) -> TabNotches:
         self.font:str|Font = font
-        self.on_reshuffle:Function[None] = lambda: None
+        self.on_reshuffle:Function[int,int,None] = lambda idxa, idxb: None
         self.notebook:Notebook = notebook
+        self.notches:list[Notch] = []
+        self.keys:list[int] = []
+        self.widths:FenwickTree = FenwickTree()
+        self.next_key:int = 0
+        self.overscan:int = overscan
+        self._views:dict[Notch,TabNotch] = {}
+        self._free:list[TabNotch] = []
+        self._refresh_id:str = None
+        self.notch_dragging:Notch = None
+        self.min_size:int = min_size
+        self.dragging:bool = False
+        self._drag_bindings:list[tuple[str,str]] = []
+        self._drag_id:str = None
         super().__init__(notebook, bg=NOTCH_BG, hscroll=True, vscroll=False,
                          HScrollBarClass=BetterScrollBarHorizontal,
                          hscrolltop=True, scrollbar_kwargs={"thickness":4})
-        self.add_notch:TabNotch = TabNotch(self, font=self.font)
-        self.add_notch.grid(row=1, column=1)
-        self.add_notch.rename("+")
+        self.line_height:int = int(super().tk.call("font", "metrics", font,
+                                                   "-linespace"))
         self.h_scrollbar.hide:bool = HIDE_SCROLLBAR
-        self.notches:list[TabNotch] = []
-        self.notch_dragging:bool = None
-        self.min_size:int = min_size
-        self.dragging:bool = False
-        height:int = self.add_notch.winfo_reqheight()
-        super().resize(height=height)
-        self.tmp_notch:tk.Frame = tk.Frame(self, bg=NOTCH_BG, height=height,
-                                           highlightthickness=0, bd=0)
+        self.add_notch:TabNotch = TabNotch(self, font=self.font)
+        plus:Notch = Notch(self)
+        plus.view:TabNotch = self.add_notch
+        plus.rename("+")
+        self.viewport:ViewportScroller = self.virtualise("x",
+                                                        self.get_content_width,
+                                                        self.line_height,
+                                                        self._schedule_refresh)
+        super().resize(height=2*self.line_height)
+        super().config(height=2*self.line_height)
+
+        self.dropdown:tk.Label = tk.Label(self.master_frame, text="▾",
+                                          bg=NOTCH_BG, fg="white", font=font,
+                                          padx=TabNotch.PADX, **WIDGET_KWARGS)
+        self.dropdown.bind("<Button-1>", self.show_all_tabs)
+        self.all_tabs_menu:tk.Menu = tk.Menu(self.dropdown, tearoff=False)
 
         make_bind_frame(self)
         self.bind("<ButtonPress-1>", self.start_dragging, add=True)
-        self.bind_all("<B1-Motion>", self.drag, add=True)
-        self.bind_all("<Motion>", self.drag, add=True)
-        self.bind_all("<ButtonRelease-1>", self.end_dragging, add=True)
-
-    def add(self) -> TabNotch:
-        notch:TabNotch = TabNotch(self, min_size=self.min_size, font=self.font)
-        notch.grid(row=1, column=len(self.notches))
-        self.add_notch.grid(row=1, column=len(self.notches)+1)
+        self._schedule_refresh()
+
+    def measure(self, text:str) -> int:
+        return int(super().tk.call("font", "measure", self.font, text))
+
+    def add(self) -> Notch:
+        notch:Notch = Notch(self, min_size=self.min_size)
+        notch.key:int = self.next_key
+        self.next_key += 1
         self.notches.append(notch)
+        self.keys.append(notch.key)
+        self.widths.append(notch.width)
+        self._schedule_refresh()
         return notch
 
-    def clicked(self, notch:TabNotch) -> None:
-        if notch == self.add_notch:
+    def index_of(self, notch:Notch) -> int:
+        idx:int = bisect_left(self.keys, notch.key)
+        assert self.notches[idx] == notch, "InternalError"
+        return idx
+
+    def notch_resized(self, notch:Notch) -> None:
+        """
+        Called by `Notch.rename` when its width changes
+        """
+        idx:int = bisect_left(self.keys, notch.key)
+        if (idx < len(self.notches)) and (self.notches[idx] == notch):
+            self.widths[idx] = notch.width
+            self._schedule_refresh()
+
+    def clicked(self, view:TabNotch) -> None:
+        if view == self.add_notch:
             self.notebook.event_generate("<<Tab-Create>>")
-        else:
-            notch.page.focus()
+        elif view.notch is not None:
+            view.notch.page.focus()
 
-    def close(self, notch:TabNotch) -> None:
-        if notch != self.add_notch:
-            notch.page.close()
+    def close(self, view:TabNotch) -> None:
+        if (view != self.add_notch) and (view.notch is not None):
+            view.notch.page.close()
 
-    def remove(self, notch:TabNotch) -> None:
-        assert notch in self.notches, "InternalError"
-        idx:int = self.notches.index(notch)
+    def remove(self, notch:Notch) -> None:
+        if notch == self.notch_dragging:
+            self.end_dragging()
+        idx:int = self.index_of(notch)
         self.notches.pop(idx)
-        for i in range(idx, len(self.notches)):
-            self.notches[i].grid(row=1, column=i)
+        self.keys.pop(idx)
+        self.widths.pop(idx)
+        if notch in self._views:
+            self._release(notch)
+        notch.key:int = None
+        # Don't let the gaps in the keys grow forever
+        if self.next_key > 2*len(self.notches)+16:
+            self._compact_keys()
+        self._schedule_refresh()
+
+    def _compact_keys(self) -> None:
+        for i, notch in enumerate(self.notches):
+            notch.key:int = i
+        self.keys:list[int] = list(range(len(self.notches)))
+        self.next_key:int = len(self.notches)
+
+    def show_all_tabs(self, event:tk.Event) -> str:
+        """
+        Shows a dropdown menu with all of the tabs. The menu is refilled
+          from `self.notches` each time it's shown.
+        """
+        self.all_tabs_menu.delete(0, "end")
+        for notch in self.notches:
+            self.all_tabs_menu.add_command(label=notch.text,
+                                           command=notch.page.focus)
+        self.all_tabs_menu.tk_popup(event.x_root, event.y_root)
+        return "break"
+
+    def get_content_width(self) -> int:
+        return self.widths.total() + self.add_notch.notch.width
+
+    def _schedule_refresh(self, event:tk.Event=None) -> None:
+        if self._refresh_id is None:
+            self._refresh_id:str = super().after_idle(self._refresh)
+
+    def _release(self, notch:Notch) -> None:
+        view:TabNotch = self._views.pop(notch)
+        notch.view:TabNotch = None
+        view.notch:Notch = None
+        view.place_forget()
+        self._free.append(view)
+
+    def _refresh(self) -> None:
+        """
+        Works out which notches are visible, recycles the canvases of the
+          rest and places the visible ones.
+        """
+        self._refresh_id:str = None
+        total:int = self.widths.total()
+        visible_width:int = self.viewport.get_view()
+        left:int = self.viewport.clamp()
+        self.add_notch.place(x=total-left, y=0)
+        if len(self.notches) == 0:
+            first, last = 0, -1
+        else:
+            first:int = max(0, self.widths.find(left)-self.overscan)
+            last:int = min(len(self.notches)-1,
+                           self.widths.find(left+visible_width)+self.overscan)
+        keep:set[Notch] = set(self.notches[first:last+1])
+        keep.add(self.notch_dragging)
+        for notch in tuple(self._views):
+            if notch not in keep:
+                self._release(notch)
+        created:bool = False
+        x:int = self.widths.prefix(first)
+        for idx in range(first, last+1):
+            notch:Notch = self.notches[idx]
+            view:TabNotch = self._views.get(notch, None)
+            if view is None:
+                if self._free:
+                    view:TabNotch = self._free.pop()
+                else:
+                    view:TabNotch = TabNotch(self, font=self.font)
+                    created:bool = True
+                self._views[notch] = notch.view = view
+            view.show(notch)
+            if not (self.dragging and (notch == self.notch_dragging)):
+                view.place(x=x-left, y=0)
+            x += self.widths[idx]
+        if created and self.dragging:
+            tk.Misc.lift(self.notch_dragging.view)
+        if self.get_content_width() > visible_width:
+            self.dropdown.grid(row=1, column=2, sticky="news")
+        else:
+            self.dropdown.grid_remove()
 
     def start_dragging(self, event:tk.Event) -> None:
+        """
+        The motion/release bindings only exist (on the pressed notch which
+          gets all of the mouse events until the button is released) while
+          a drag is in progress.
+        """
         if not isinstance(event.widget, TabNotch):
             return None
-        if event.widget == self.add_notch:
+        if (event.widget == self.add_notch) or (event.widget.notch is None):
             return None
-        self.notch_dragging:TabNotch = event.widget
+        if self.notch_dragging is not None:
+            self.end_dragging()
+        self.notch_dragging:Notch = event.widget.notch
         self.dragx:int = event.x # event.x_root - event.widget.winfo_rootx()
+        self.drag_start_x_root:int = event.x_root
+        self.drag_x_root:int = event.x_root
+        for seq, func in (("<B1-Motion>", self.drag),
+                          ("<Motion>", self.drag),
+                          ("<ButtonRelease-1>", self.end_dragging)):
+            funcid:str = event.widget.bind(seq, func, add=True)
+            self._drag_bindings.append((seq, funcid))
         return "break"
 
     def end_dragging(self, event:tk.Event=None) -> str:
         if self.notch_dragging is None:
             return None
+        if self._drag_id is not None:
+            super().after_cancel(self._drag_id)
+            self._drag_id:str = None
+        # The dragged notch always keeps its canvas (look at `_refresh`)
+        view:TabNotch = self.notch_dragging.view
+        if (view is not None) and view.winfo_exists():
+            for seq, funcid in self._drag_bindings:
+                view.unbind(seq, funcid)
+        self._drag_bindings.clear()
+        self.notch_dragging:Notch = None
         if self.dragging:
-            self.tmp_notch.grid_forget()
-            self.notch_dragging.grid(row=1, column=self.tmp_notch.idx)
-            self.notches[self.tmp_notch.idx] = self.notch_dragging
-        self.notch_dragging:TabNotch = None
-        self.dragging:bool = False
+            self.dragging:bool = False
+            self._schedule_refresh()
         return "break"
 
     def drag(self, event:tk.Event) -> str:
+        """
+        Only stores the mouse position. The actual work is done at most
+          once per `DRAG_FRAME_MS` by `_drag_frame`.
+        """
         if self.notch_dragging is None:
             return None
         if not (event.state & BUTTON1_TK_STATE):
             self.end_dragging()
             return None
+        self.drag_x_root:int = event.x_root
+        if self._drag_id is None:
+            self._drag_id:str = super().after(DRAG_FRAME_MS, self._drag_frame)
+        return "break"
+
+    def _drag_frame(self) -> None:
+        self._drag_id:str = None
+        if self.notch_dragging is None:
+            return None
         if not self.dragging:
-            if abs(event.x-self.dragx) < NOT_DRAG_DIST:
+            if abs(self.drag_x_root-self.drag_start_x_root) < NOT_DRAG_DIST:
                 return None
             self.dragging:bool = True
-            self.tmp_notch.x:int = self.get_start_x(self.notch_dragging)
-            width:int = self.notch_dragging.winfo_width()
-            self.tmp_notch.width=width
-            self.tmp_notch.config(width=width)
-            idx:int = self.notches.index(self.notch_dragging)
-            self.tmp_notch.page = self.notch_dragging.page
-            self.tmp_notch.grid(row=1, column=idx)
-            self.tmp_notch.idx:int = idx
-            tk.Misc.lift(self.notch_dragging)
-            self.notches[idx] = self.tmp_notch
-
-        x:int = event.x_root - super().winfo_rootx()
-        delta:int = self.calculate_idx_delta(x-self.dragx)
-        if delta != 0:
+            self.drag_rootx:int = super().winfo_rootx()
+            self.drag_idx:int = self.index_of(self.notch_dragging)
+            tk.Misc.lift(self.notch_dragging.view)
+
+        # In the same coordinates as `self.widths` (not the viewport's)
+        x:int = self.drag_x_root - self.drag_rootx + self.viewport.offset
+        # The mouse might have moved past more than 1 notch since the last
+        #   frame so keep swapping until the dragged notch is in the right
+        #   place
+        while True:
+            delta:int = self.calculate_idx_delta(x-self.dragx)
+            if delta == 0:
+                break
             self._reshiffle(delta)
-        self.notch_dragging.place(x=x-self.dragx, y=0)
-        return "break"
+        self.notch_dragging.view.place(x=x-self.dragx-self.viewport.offset,
+                                       y=0)
 
-    def get_start_x(self, notch:TabNotch) -> int:
-        total:int = 0
-        for n in self.notches:
-            if n == notch:
-                return total
-            total += n.width
-        raise RuntimeError("InternalError: Notch not in self.notches???")
+    def get_start_x(self, notch:Notch) -> int:
+        return self.widths.prefix(self.index_of(notch))
 
     def calculate_idx_delta(self, notch_start:int) -> int:
-        if self.tmp_notch.winfo_x() < self.notch_dragging.winfo_x():
+        # Use the cached widths instead of asking tcl (`winfo_x`)
+        idx:int = self.drag_idx
+        slot_start:int = self.widths.prefix(idx)
+        if slot_start < notch_start:
             # dragging =>
-            if self.tmp_notch == self.notches[-1]:
+            if idx == len(self.notches)-1:
                 return 0
-            next_notch:TabNotch = self.notches[self.tmp_notch.idx+1]
-            notch_end:int = notch_start + self.notch_dragging.width
-            next_notch_start:int = self.tmp_notch.x + self.tmp_notch.width
-            if notch_end > next_notch_start+next_notch.width/2:
+            notch_end:int = notch_start + self.widths[idx]
+            next_notch_start:int = slot_start + self.widths[idx]
+            if notch_end > next_notch_start+self.widths[idx+1]/2:
                 return +1
             else:
                 return 0
         else:
             # dragging <=
-            if self.tmp_notch == self.notches[0]:
+            if idx == 0:
                 return 0
-            prev_notch:TabNotch = self.notches[self.tmp_notch.idx-1]
-            prev_notch_half:int = self.tmp_notch.x - prev_notch.width/2
+            prev_notch_half:int = slot_start - self.widths[idx-1]/2
             if notch_start < prev_notch_half:
                 return -1
             else:
                 return 0
 
     def _reshiffle(self, delta:int) -> None:
-        idx:int = self.tmp_notch.idx
-        self.tmp_notch.idx += delta
+        idx:int = self.drag_idx
+        self.drag_idx += delta
         self.swap(self.notches, idx, idx+delta)
-        self.tmp_notch.x += self.notches[idx].width * delta
+        self.swap(self.widths, idx, idx+delta)
         for i in (idx, idx+delta):
-            self.notches[i].grid(row=1, column=i)
+            self.notches[i].key:int = self.keys[i]
+        # Move the notch that was swapped with the dragged one
+        self._schedule_refresh()
         self.on_reshuffle(idx, idx+delta)
 
     @staticmethod
@@ -237,15 +518,68 @@ CONTROL_NUMBERS_RESTRICT:bool = False
 HIDE_SCROLLBAR:bool = True
 
 class NotebookPage:
-    __slots__ = "notebook", "frame", "notch"
-
-    def __init__(self, notebook:Notebook, frame:tk.Frame, notch:TabNotch):
+    """
+    If the page is created with a `factory`, its widgets are only created
+      (by calling `factory(page)`) the first time it's focused. The
+      factory should create the widgets and return the widget that should
+      be added to the page (or call `page.add_frame` itself and return
+      `None`).
+    Pages with a factory can be hibernated (see `Notebook.max_materialised`)
+      in which case `serialise(page)` is called and its result is stored
+      in `page.state` before the page's widgets are destroyed. The
+      factory can use `page.state` to restore the page.
+    """
+    __slots__ = "notebook", "frame", "notch", "factory", "serialise", \
+                "state", "content"
+
+    def __init__(self, notebook:Notebook, frame:tk.Frame, notch:Notch,
+                 factory:Function[NotebookPage,tk.Misc|None]=None,
+                 serialise:Function[NotebookPage,object]=None):
+        self.factory:Function[NotebookPage,tk.Misc|None] = factory
+        self.serialise:Function[NotebookPage,object] = serialise
         self.notebook:Notebook = notebook
-        self.notch:TabNotch = notch
+        self.content:tk.Misc = None
+        self.notch:Notch = notch
         self.frame:tk.Misc = frame
+        self.state:object = None
+
+    def is_materialised(self) -> bool:
+        return self.frame is not None
+
+    def _materialise(self) -> None:
+        if self.frame is not None:
+            return None
+        self.frame:tk.Frame = self.notebook._create_page_frame()
+        if self.factory is not None:
+            content:tk.Misc|None = self.factory(self)
+            if content is not None:
+                self.add_frame(content)
+
+    def _hibernate(self) -> None:
+        """
+        Destroys the page's widgets (after calling `serialise`). They will
+          be recreated by the factory the next time the page is focused.
+        """
+        assert self.factory is not None, "Can't hibernate without a factory"
+        if self.frame is None:
+            return None
+        if self.serialise is not None:
+            self.state:object = self.serialise(self)
+        if self.content is not None:
+            self.content.destroy()
+            self.content:tk.Misc = None
+        self.frame.destroy()
+        self.frame:tk.Frame = None
 
     def add_frame(self, frame:tk.Misc) -> NotebookPage:
+        self._materialise()
+        self.content:tk.Misc = frame
         frame.pack(in_=self.frame, fill="both", expand=True)
+        if self.notebook.switch_mode == "stack":
+            if self.notebook.curr_page == self:
+                frame.lift()
+            else:
+                frame.lower()
         if TAB_CONTROLS:
             #frame.bind("<Control-Key><Tab>", self.notebook.switch_next_tab)
             frame.bind("<Control-Tab>", self.notebook.switch_next_tab, add=True)
@@ -288,8 +622,8 @@ class NotebookPage:
         self.notebook.tab_destroy(self)
 
     def _close(self) -> None:
-        self.notch.destroy()
-        self.frame.destroy()
+        if self.frame is not None:
+            self.frame.destroy()
 
     def focus(self) -> NotebookPage:
         self.notebook._tab_switch_to(self)
@@ -297,11 +631,35 @@ class NotebookPage:
 
 
 class Notebook(tk.Frame):
+    """
+    Set `max_materialised` to limit the number of pages (created with a
+      factory) that have their widgets alive. The least recently focused
+      pages are hibernated (look at `NotebookPage`).
+    `switch_mode` can be:
+        "pack"     Only the current page is packed. Switching tabs
+                   unpacks the old page and packs the new one so tkinter
+                   has to lay out the new page again.
+        "stack"    All of the pages are placed on top of each other and
+                   switching tabs just raises the new page so nothing
+                   has to be laid out again. The notebook doesn't ask for
+                   the size of its pages so give it a size (for example
+                   with `pack(fill="both", expand=True)`). The widgets
+                   passed to `NotebookPage.add_frame` should be children
+                   of the notebook (or of `page.frame`).
+    Set `on_switch_latency` to `function(page, seconds)` to get told how
+      long each tab switch took (until tkinter was idle again).
+    """
     __slots__ = "pages", "next_id", "curr_page", "notches", "bottom", \
-                "on_try_close"
+                "on_try_close", "max_materialised", "_lru", "switch_mode", \
+                "on_switch_latency"
 
     def __init__(self, master:tk.Misc, min_tab_notch_size:int=0,
-                 font:str="TkTextFont") -> Notebook:
+                 font:str="TkTextFont", switch_mode:str="pack") -> Notebook:
+        assert switch_mode in ("pack", "stack"), "ValueError"
+        self.on_switch_latency:Function[NotebookPage,float,None] = None
+        self._lru:OrderedDict[NotebookPage,None] = OrderedDict()
+        self.max_materialised:int|None = None
+        self.switch_mode:str = switch_mode
         self.pages:list[NotebookPage] = []
         self.curr_page:NotebookPage = None
         self.on_try_close:Function[NotebookPage,Break] = lambda page: False
@@ -314,15 +672,48 @@ class Notebook(tk.Frame):
         self.bottom:tk.Frame = tk.Frame(self, **WIDGET_KWARGS, bg="black")
         self.bottom.pack(fill="both", expand=True)
 
-    def tab_create(self) -> NotebookPage:
-        notch:TabNotch = self.notches.add()
+    def tab_create(self, factory:Function[NotebookPage,tk.Misc|None]=None,
+                   serialise:Function[NotebookPage,object]=None) -> NotebookPage:
+        """
+        Creates a new page. If `factory` is given, the page's widgets are
+          only created when it's first focused (look at `NotebookPage`).
+        """
+        notch:Notch = self.notches.add()
         notch.rename("Untitled")
-        frame:tk.Frame = tk.Frame(self.bottom, **WIDGET_KWARGS, bg="black")
-        page:NotebookPage = NotebookPage(self, frame=frame, notch=notch)
+        if factory is None:
+            frame:tk.Frame = self._create_page_frame()
+        else:
+            frame:tk.Frame = None
+        page:NotebookPage = NotebookPage(self, frame=frame, notch=notch,
+                                         factory=factory, serialise=serialise)
         notch.page:NotebookPage = page
         self.pages.append(page)
         return page
 
+    def _create_page_frame(self) -> tk.Frame:
+        frame:tk.Frame = tk.Frame(self.bottom, **WIDGET_KWARGS, bg="black")
+        if self.switch_mode == "stack":
+            # Lay it out now (under the current page) so that switching to
+            #   it later is just a `lift`
+            frame.place(x=0, y=0, relwidth=1, relheight=1)
+            frame.lower()
+        return frame
+
+    def _touch_page(self, page:NotebookPage) -> None:
+        """
+        Marks `page` as the most recently used and hibernates the least
+          recently used pages if there are more than `max_materialised`
+        """
+        if page.factory is None:
+            return None
+        self._lru[page] = None
+        self._lru.move_to_end(page)
+        if self.max_materialised is None:
+            return None
+        while len(self._lru) > max(1, self.max_materialised):
+            old, _ = self._lru.popitem(last=False)
+            old._hibernate()
+
     def iter_pages(self) -> Iterator[NotebookPage]:
         for notch in self.notches.notches:
             yield notch.page
@@ -330,15 +721,42 @@ class Notebook(tk.Frame):
     def _tab_switch_to(self, page:NotebookPage) -> None:
         if page == self.curr_page:
             return None
-        if self.curr_page is not None:
-            self.curr_page.notch.tell_unfocused()
-            self.curr_page.frame.pack_forget()
+        if self.on_switch_latency is not None:
+            start:float = perf_counter()
+        old_page:NotebookPage = self.curr_page
+        self.curr_page:NotebookPage = page
+        if old_page is not None:
+            old_page.notch.tell_unfocused()
+            if self.switch_mode == "pack":
+                old_page.frame.pack_forget()
+            elif page is None:
+                self._stack_lower(old_page)
         if page is not None:
-            page.frame.pack(fill="both", expand=True)
+            page._materialise()
+            self._touch_page(page)
+            if self.switch_mode == "pack":
+                page.frame.pack(fill="both", expand=True)
+            else:
+                page.frame.lift()
+                if page.content is not None:
+                    page.content.lift()
             page.notch.tell_focused()
-        self.curr_page:NotebookPage = page
         super().event_generate("<<Tab-Switched>>")
         self.see(self.curr_page)
+        if self.on_switch_latency is not None:
+            # Idle callbacks run after tkinter has finished laying out the
+            #   widgets
+            report = lambda: self.on_switch_latency(page, perf_counter()-start)
+            super().after_idle(report)
+
+    def _stack_lower(self, page:NotebookPage) -> None:
+        """
+        Hides a page when `switch_mode` is "stack" and there is no new
+          page to raise over it
+        """
+        page.frame.lower()
+        if page.content is not None:
+            page.content.lower()
 
     def switch_prev_tab(self, event:tk.Event=None) -> str:
         page:NotebookPage = self._switch_next_prev_tab(strides=-1, default=-1)
@@ -360,7 +778,7 @@ class Notebook(tk.Frame):
                 return None
             return self.pages[default]
         else:
-            idx:int = self.pages.index(self.curr_page) + strides
+            idx:int = self.notches.index_of(self.curr_page.notch) + strides
             return self.pages[idx%len(self.pages)]
 
     def tab_destroy(self, page:NotebookPage) -> None:
@@ -373,8 +791,10 @@ class Notebook(tk.Frame):
                 self.switch_prev_tab()
         assert self.curr_page != page, "SanityCheck"
         assert self.curr_page in self.pages+[None], "SanityCheck"
+        idx:int = self.notches.index_of(page.notch)
         page._close()
-        self.pages.remove(page)
+        self._lru.pop(page, None)
+        self.pages.pop(idx)
         self.notches.remove(page.notch)
 
     def update_pages_list(self, idxa:int, idxb:int) -> None:
@@ -398,16 +818,10 @@ class Notebook(tk.Frame):
         return "break"
 
     def see(self, page:NotebookPage) -> None:
-        minx:int = 0
-        maxx:int = 0
-        for p, n in zip(self.pages, self.notches.notches):
-            maxx += n.width
-            if p == page:
-                break
-            else:
-                minx += n.width
-        full_width:int = sum(n.width for n in self.notches.notches)
-        print("Implement BetterFrame.xscroll_to", minx, maxx, full_width)
+        if page is None:
+            return None
+        minx:int = self.notches.get_start_x(page.notch)
+        self.notches.xscroll_to(minx, minx+page.notch.width)
 
 
 if __name__ == "__main__":
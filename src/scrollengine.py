@@ -0,0 +1,119 @@
+from __future__ import annotations
+import tkinter as tk
+
+
+FRAME_MS:int = 16 # How often the accumulated scrolling is applied
+WHEEL_NOTCH_DELTA:int = 120 # The `event.delta` of one notch on Windows
+AQUA_NOTCH_DELTA:int = 1 # The `event.delta` of one notch on macOS
+MIN_VELOCITY:float = 0.5 # Momentum stops below this many pixels per frame
+
+
+class ScrollEngine:
+    """
+    Turns mouse wheel events into pixel scrolling. Used by `BetterFrame`,
+      `BetterCanvas` and `BetterText` so that all 3 scroll the same way.
+    * The distance is proportional to `event.delta` (hi-res touchpads
+      send lots of events with small deltas) and one notch is
+      `pixels_per_notch` pixels (or an `(x, y)` tuple of pixels). A notch
+      is a delta of 120 on Windows but tk on macOS sends deltas of ±1
+      (or a few for fast scrolling) per notch.
+    * Fractional pixels are accumulated instead of being rounded away.
+    * The accumulated distance is applied at most once per `FRAME_MS`
+      milliseconds by calling `scroll_x(pixels)`/`scroll_y(pixels)`.
+    * If `momentum` is between 0 and 1, each wheel event starts a glide
+      that decays by `momentum` every frame (the total distance is the
+      same as without momentum).
+    Pass in `None` for `scroll_x`/`scroll_y` to ignore that direction.
+    Holding shift scrolls horizontally.
+    """
+    __slots__ = "widget", "scroll_x", "scroll_y", "pixels_per_notch", \
+                "momentum", "_velocity", "_pending", "_frame_id", \
+                "_notch_delta"
+
+    def __init__(self, widget:tk.Misc, scroll_x:Function[int,None],
+                 scroll_y:Function[int,None],
+                 pixels_per_notch:int|tuple[int,int]=40,
+                 momentum:float=0) -> ScrollEngine:
+        assert 0 <= momentum < 1, "momentum must be in [0, 1)"
+        if isinstance(pixels_per_notch, int):
+            pixels_per_notch:tuple[int,int] = (pixels_per_notch,)*2
+        self.pixels_per_notch:tuple[int,int] = pixels_per_notch
+        self.scroll_x:Function[int,None] = scroll_x
+        self.scroll_y:Function[int,None] = scroll_y
+        self.momentum:float = momentum
+        self.widget:tk.Misc = widget
+        # Indexed by 0 for the x axis and 1 for the y axis
+        self._velocity:list[float] = [0.0, 0.0]
+        self._pending:list[float] = [0.0, 0.0]
+        self._frame_id:str = None
+        # `widget` might not be a tk widget yet so look this up later
+        self._notch_delta:int = None
+
+    def get_pixels(self, event:tk.Event, axis:int) -> float:
+        """
+        Returns how many pixels (positive is down/right) a mouse wheel
+          event should scroll.
+        """
+        pixels_per_notch:int = self.pixels_per_notch[axis]
+        if event.num == 4:
+            return -pixels_per_notch
+        if event.num == 5:
+            return pixels_per_notch
+        if self._notch_delta is None:
+            system:str = self.widget.tk.call("tk", "windowingsystem")
+            if system == "aqua":
+                self._notch_delta:int = AQUA_NOTCH_DELTA
+            else:
+                self._notch_delta:int = WHEEL_NOTCH_DELTA
+        return -event.delta/self._notch_delta*pixels_per_notch
+
+    def on_wheel(self, event:tk.Event) -> str:
+        """
+        Bind this to <MouseWheel>, <Button-4> and <Button-5>
+        """
+        axis:int = 0 if (event.state&1) else 1
+        if (self.scroll_x, self.scroll_y)[axis] is None:
+            return None
+        self.add(axis, self.get_pixels(event, axis))
+        return "break"
+
+    def add(self, axis:int, pixels:float) -> None:
+        """
+        Scrolls by `pixels` on `axis` (0 for x and 1 for y) in the next
+          frame(s)
+        """
+        if self.momentum == 0:
+            self._pending[axis] += pixels
+        else:
+            self._velocity[axis] += pixels*(1-self.momentum)
+        if self._frame_id is None:
+            self._frame_id:str = self.widget.after(FRAME_MS, self._frame)
+
+    def stop(self) -> None:
+        if self._frame_id is not None:
+            self.widget.after_cancel(self._frame_id)
+            self._frame_id:str = None
+        self._velocity:list[float] = [0.0, 0.0]
+        self._pending:list[float] = [0.0, 0.0]
+
+    def _frame(self) -> None:
+        self._frame_id:str = None
+        gliding:bool = False
+        for axis, scroll in enumerate((self.scroll_x, self.scroll_y)):
+            velocity:float = self._velocity[axis]
+            if velocity != 0:
+                self._pending[axis] += velocity
+                velocity *= self.momentum
+                if abs(velocity) < MIN_VELOCITY:
+                    # Add the rest of the glide now so no distance is lost
+                    self._pending[axis] += velocity/(1-self.momentum)
+                    velocity:float = 0.0
+                else:
+                    gliding:bool = True
+                self._velocity[axis] = velocity
+            pixels:int = int(self._pending[axis])
+            self._pending[axis] -= pixels
+            if pixels != 0:
+                scroll(pixels)
+        if gliding:
+            self._frame_id:str = self.widget.after(FRAME_MS, self._frame)